@@ -1,71 +1,644 @@
-import json, os, urllib.request, urllib.parse
-from http.server import BaseHTTPRequestHandler, HTTPServer
+import json, os, re, sys, math, time, socket, select, asyncio, datetime, threading, http.client, urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 HOST = "0.0.0.0"
 PORT = 8080
-PLUGIN = "http://127.0.0.1:8765"
+PLUGIN_HOST = "127.0.0.1"
+PLUGIN_PORT = 8765
 APP_ID = "camcookieactions"
+# Plugin engine calls: timeout per call, connections kept open, and how
+# many failures in a row open the circuit breaker for how long (seconds)
+PLUGIN_TIMEOUT = 2.0
+PLUGIN_POOL_SIZE = 8
+BREAKER_FAILURES = 3
+BREAKER_RESET = 5.0
+# The engine closes keep-alive connections idle for 5 s; drop ours sooner
+PLUGIN_IDLE_MAX = 4.0
+BASE = os.path.dirname(os.path.abspath(__file__))
+ACTIONS_FILE = os.path.join(BASE, "actions.json")
+# How often actions.json is checked for edits (seconds)
+ACTIONS_WATCH_INTERVAL = 1.0
+# Shortest "every" trigger interval accepted (seconds)
+EVERY_MIN_SECONDS = 0.1
+# Fuzzy voice matches below this confidence are ignored
+MATCH_MIN_SCORE = 0.75
+# Words voice transcriptions add that don't change the command
+FILLER_WORDS = {"a", "an", "the", "please", "my", "now"}
 
-def pget(path, params=None):
-    if params is None:
-        params = {}
-    params["app_id"] = APP_ID
-    url = f"{PLUGIN}{path}?{urllib.parse.urlencode(params)}"
-    with urllib.request.urlopen(url, timeout=2) as r:
-        t = r.read().decode("utf-8")
+class PluginError(Exception):
+    pass
+
+class PluginClient:
+    """
+    Keep-alive connections to the plugin engine, shared by every thread.
+
+    At most `size` calls are in flight at once and each has its own
+    timeout. After BREAKER_FAILURES failed calls in a row the breaker
+    opens: calls fail at once for BREAKER_RESET seconds, then a single
+    trial call decides whether it closes again.
+    """
+
+    def __init__(self, host, port, size, timeout):
+        self.host, self.port, self.timeout = host, port, timeout
+        self.idle = []       # (connection, when it went idle)
+        self.lock = threading.Lock()
+        self.slots = threading.BoundedSemaphore(size)
+        self.failures = 0
+        self.opened = None   # when the breaker opened (monotonic)
+        self.trial = False
+
+    def _allow(self):
+        with self.lock:
+            if self.opened is None:
+                return
+            if self.trial or time.monotonic() - self.opened < BREAKER_RESET:
+                raise PluginError("plugin engine unavailable")
+            self.trial = True
+
+    def _record(self, ok):
+        # ok=None: the engine wasn't reached, so only the trial is released
+        with self.lock:
+            self.trial = False
+            if ok is None:
+                return
+            if ok:
+                self.failures, self.opened = 0, None
+                return
+            self.failures += 1
+            if self.failures >= BREAKER_FAILURES or self.opened is not None:
+                self.opened = time.monotonic()
+
+    def _checkout(self):
+        # An idle connection the engine may have closed is never reused:
+        # too old, or readable (EOF) while no request is pending
+        while True:
+            with self.lock:
+                if not self.idle:
+                    return None
+                c, since = self.idle.pop()
+            if c.sock and time.monotonic() - since < PLUGIN_IDLE_MAX \
+                    and not select.select([c.sock], [], [], 0)[0]:
+                return c
+            c.close()
+
+    def _send(self, method, path, body, timeout, idempotent):
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        while True:
+            c = self._checkout()
+            reused = c is not None
+            if not reused:
+                c = http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+            else:
+                c.sock.settimeout(timeout)
+            try:
+                c.request(method, path, body=body, headers=headers)
+                r = c.getresponse()
+                t = r.read().decode("utf-8", "replace")
+            except socket.timeout:
+                c.close()
+                raise
+            except (http.client.HTTPException, OSError):
+                c.close()
+                # A reused socket may have been closed by the engine; retry,
+                # unless the call may already have run (click, move, batch)
+                if not reused or not idempotent:
+                    raise
+                continue
+            with self.lock:
+                self.idle.append((c, time.monotonic()))
+            return r.status, t
+
+    def request(self, method, path, body=None, timeout=None, idempotent=False):
+        self._allow()
+        ok = None
         try:
-            return json.loads(t)
-        except:
-            return {"raw": t}
+            timeout = timeout or self.timeout
+            if not self.slots.acquire(timeout=timeout):
+                raise PluginError("plugin engine busy")
+            ok = False
+            try:
+                status, t = self._send(method, path, body, timeout, idempotent)
+            except (http.client.HTTPException, OSError) as e:
+                raise PluginError(f"plugin call failed: {e}")
+            finally:
+                self.slots.release()
+            try:
+                d = json.loads(t)
+            except ValueError:
+                d = {"raw": t}
+            # A refused call (403 not connected, 4xx/5xx) is a failure too
+            if status >= 400:
+                raise PluginError(f"plugin engine answered {status}: {d.get('error', t[:80])}")
+            ok = True
+        finally:
+            # Settles the breaker on every path, so a trial never stays open
+            self._record(ok)
+        return d
+
+PLUGIN = PluginClient(PLUGIN_HOST, PLUGIN_PORT, PLUGIN_POOL_SIZE, PLUGIN_TIMEOUT)
+
+def _prequest(method, path, body=None, idempotent=False):
+    return PLUGIN.request(method, path, body, idempotent=idempotent)
+
+def ppath(path, params=None):
+    params = dict(params or {})
+    params["app_id"] = APP_ID
+    return f"{path}?{urllib.parse.urlencode(params)}"
+
+def pget(path, params=None):
+    return _prequest("GET", ppath(path, params))
+
+def pbatch(ops):
+    b = json.dumps({"app_id": APP_ID, "ops": ops})
+    return _prequest("POST", "/batch", b)
 
 def load_actions():
-    with open("actions.json") as f:
+    with open(ACTIONS_FILE) as f:
         return json.load(f)
 
-ACTIONS = load_actions()
+def norm(t):
+    return " ".join(re.findall(r"[a-z0-9]+", t.lower()))
+
+def edit_distance(a, b, limit):
+    # Levenshtein distance, or limit + 1 once it's certain to exceed limit
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        if min(cur) > limit:
+            return limit + 1
+        prev = cur
+    return prev[-1]
+
+def deletes(w, r):
+    out = edge = {w}
+    for _ in range(r):
+        edge = {e[:i] + e[i + 1:] for e in edge for i in range(len(e))}
+        out = out | edge
+    return out
+
+class NearWords:
+    # Symmetric-delete index: two words within edit distance r always
+    # share a string made by deleting up to r letters from each, so a
+    # search is a few dict lookups plus checking the hits
+    MAX_R = 2
+
+    def __init__(self):
+        self.dels = {}
+
+    def add(self, w):
+        for d in deletes(w, self.MAX_R):
+            self.dels.setdefault(d, set()).add(w)
+
+    def search(self, w, r):
+        cands = set()
+        for d in deletes(w, r):
+            cands |= self.dels.get(d, set())
+        out = []
+        for v in cands:
+            d = edit_distance(w, v, r)
+            if d <= r:
+                out.append((v, d))
+        return out
+
+class CommandIndex:
+    """
+    Voice command lookup, rebuilt whenever actions.json loads.
+
+    Exact (normalized) commands are a dict lookup. Anything else is
+    matched word by word: each spoken word is looked up in the command
+    vocabulary, or its near misses found through NearWords, and commands
+    sharing those words are scored by how much of both phrases matched.
+    match() returns (action_id, confidence between 0 and 1).
+    """
+
+    def __init__(self, actions):
+        self.exact = {}
+        self.words = {}      # word -> ids of commands using it
+        self.sizes = {}      # action id -> number of words in its command
+        self.order = {}      # action id -> position in actions.json, for ties
+        self.near = NearWords()
+        for aid, a in actions.items():
+            c = norm(a.get("command", ""))
+            if not c:
+                continue
+            self.exact.setdefault(c, aid)
+            ws = set(c.split()) - FILLER_WORDS or set(c.split())
+            self.sizes[aid] = len(ws)
+            self.order[aid] = len(self.order)
+            for w in ws:
+                if w not in self.words:
+                    self.words[w] = set()
+                    self.near.add(w)
+                self.words[w].add(aid)
+
+    def _near(self, w):
+        # [(vocabulary word, similarity)] for a spoken word
+        if w in self.words:
+            return [(w, 1.0)]
+        r = 0 if len(w) <= 1 else 1 if len(w) <= 6 else 2
+        if not r:
+            return []
+        return [(v, 1 - d / max(len(w), len(v))) for v, d in self.near.search(w, r)]
+
+    def match(self, text):
+        t = norm(text)
+        if t in self.exact:
+            return self.exact[t], 1.0
+        ws = set(t.split()) - FILLER_WORDS or set(t.split())
+        if not ws:
+            return None, 0.0
+        near = sorted((self._near(w) for w in ws),
+                      key=lambda n: sum(len(self.words[v]) for v, _ in n))
+        # A command reaching MATCH_MIN_SCORE shares at least `need` of the
+        # spoken words, so it uses one of the len(ws) - need + 1 rarest ones
+        need = math.ceil(MATCH_MIN_SCORE * len(ws) - 1e-9)
+        cands = set()
+        for n in near[:len(ws) - need + 1]:
+            for v, _ in n:
+                cands |= self.words[v]
+        best_id, best_score = None, 0.0
+        for aid in cands:
+            total = sum(max((s for v, s in n if aid in self.words[v]), default=0) for n in near)
+            s = total / max(len(ws), self.sizes[aid])
+            if s > best_score or (s == best_score and self.order[aid] < self.order[best_id]):
+                best_id, best_score = aid, s
+        if best_score < MATCH_MIN_SCORE:
+            return None, best_score
+        return best_id, best_score
+
 STATE = {
     "last_action": None,
     "lamp": "off",
     "last_temp": None,
-    "last_controller": None
+    "last_controller": None,
+    "actions_error": None
 }
 
-def run_action(action_id):
-    a = ACTIONS.get(action_id)
-    if not a:
-        return False
-    k = a.get("kind")
-    if k == "plugin_led":
-        on = int(a.get("on", 1))
-        pget("/led/set", {"on": on})
-        STATE["lamp"] = "on" if on else "off"
-        STATE["last_action"] = action_id
+# Each kind turns one actions.json entry into a ready-to-call plan:
+# fields are checked and the plugin request is built once, up front.
+# A bad field raises ValueError. plans is the table being compiled, for
+# macros that run other actions.
+
+def _num(a, k, d=0):
+    v = a.get(k, d)
+    if isinstance(v, bool) or not isinstance(v, (int, float)):
+        raise ValueError(f"{k} must be a number")
+    return int(v)
+
+def _led(aid, a, plans):
+    on = _num(a, "on", 1)
+    if on not in (0, 1):
+        raise ValueError("on must be 0 or 1")
+    path = ppath("/led/set", {"on": on})
+    lamp = "on" if on else "off"
+    def run():
+        if not _prequest("GET", path, idempotent=True).get("ok"):
+            return False
+        STATE["lamp"] = lamp
+        STATE["last_action"] = aid
         return True
-    if k == "plugin_mouse_move":
-        dx = a.get("dx", 0)
-        dy = a.get("dy", 0)
-        pget("/mouse/move", {"dx": dx, "dy": dy})
-        STATE["last_action"] = action_id
+    return run
+
+def _move(aid, a, plans):
+    path = ppath("/mouse/move", {"dx": _num(a, "dx"), "dy": _num(a, "dy")})
+    def run():
+        if not _prequest("GET", path).get("ok"):
+            return False
+        STATE["last_action"] = aid
         return True
-    if k == "plugin_mouse_click":
-        pget("/mouse/click")
-        STATE["last_action"] = action_id
+    return run
+
+def _click(aid, a, plans):
+    path = ppath("/mouse/click")
+    def run():
+        if not _prequest("GET", path).get("ok"):
+            return False
+        STATE["last_action"] = aid
         return True
-    if k == "plugin_temp":
-        d = pget("/temp/read")
+    return run
+
+def _temp(aid, a, plans):
+    path = ppath("/temp/read")
+    def run():
+        d = _prequest("GET", path, idempotent=True)
+        if not d.get("ok"):
+            return False
         STATE["last_temp"] = d.get("temp")
-        STATE["last_action"] = action_id
+        STATE["last_action"] = aid
         return True
-    return False
+    return run
 
-def run_command(text):
-    t = text.lower().strip()
-    for aid, a in ACTIONS.items():
-        if t == a.get("command", "").lower():
-            if run_action(aid):
-                return aid
+def _batch(aid, a, plans):
+    ops = a.get("ops")
+    if not isinstance(ops, list) or not ops:
+        raise ValueError("ops must be a non-empty list")
+    for o in ops:
+        if not isinstance(o, dict) or not isinstance(o.get("op"), str):
+            raise ValueError("each op needs an \"op\" name")
+    b = json.dumps({"app_id": APP_ID, "ops": ops})
+    def run():
+        d = _prequest("POST", "/batch", b)
+        for r in d.get("results", []):
+            if "temp" in r:
+                STATE["last_temp"] = r["temp"]
+        STATE["last_action"] = aid
+        return d.get("ok", False)
+    return run
+
+# Macro steps, each compiled to a coroutine function:
+#   {"run": "lamp_on"}                   another action
+#   {"kind": "plugin_led", "on": 1}      an inline action
+#   {"delay": 0.5}                       wait, in seconds
+#   {"repeat": 3, "steps": [...]}        loop
+#   {"parallel": [[...], [...]]}         branches run at the same time
+
+def _steps(aid, steps, plans, refs):
+    if not isinstance(steps, list) or not steps:
+        raise ValueError("steps must be a non-empty list")
+    out = [_step(aid, s, plans, refs) for s in steps]
+    async def run():
+        for s in out:
+            await s()
+    return run
+
+def _step(aid, s, plans, refs):
+    if not isinstance(s, dict):
+        raise ValueError("each step must be an object")
+    if "delay" in s:
+        d = s["delay"]
+        if isinstance(d, bool) or not isinstance(d, (int, float)) or d < 0:
+            raise ValueError("delay must be a number of seconds")
+        async def run():
+            await asyncio.sleep(d)
+        return run
+    if "run" in s:
+        ref = s["run"]
+        refs.add(ref)
+        async def run():
+            await SCHED.call(plans[ref])
+        return run
+    if "parallel" in s:
+        if not isinstance(s["parallel"], list) or not s["parallel"]:
+            raise ValueError("parallel must be a list of step lists")
+        branches = [_steps(aid, b, plans, refs) for b in s["parallel"]]
+        async def run():
+            await asyncio.gather(*(b() for b in branches))
+        return run
+    if "repeat" in s:
+        n = _num(s, "repeat")
+        body = _steps(aid, s.get("steps"), plans, refs)
+        async def run():
+            for _ in range(n):
+                await body()
+        return run
+    k = s.get("kind")
+    if k in KINDS and k != "macro":
+        p = KINDS[k](aid, s, plans)
+        async def run():
+            await SCHED.call(p)
+        return run
+    raise ValueError(f"unknown step {s!r}")
+
+def _macro(aid, a, plans):
+    refs = set()
+    body = _steps(aid, [{"repeat": _num(a, "repeat", 1), "steps": a.get("steps")}], plans, refs)
+    def run():
+        # Runs on the scheduler; the caller doesn't wait for the delays
+        SCHED.spawn(aid, body)
+        STATE["last_action"] = aid
+        return True
+    run.macro = body
+    run.refs = refs
+    return run
+
+KINDS = {
+    "plugin_led": _led,
+    "plugin_mouse_move": _move,
+    "plugin_mouse_click": _click,
+    "plugin_temp": _temp,
+    "plugin_batch": _batch,
+    "macro": _macro
+}
+
+def _cron_field(f, lo, hi):
+    out = set()
+    for part in f.split(","):
+        rng, _, step = part.partition("/")
+        if rng == "*":
+            a, b = lo, hi
+        elif "-" in rng:
+            a, b = (int(x) for x in rng.split("-"))
+        else:
+            a = b = int(rng)
+        if a < lo or b > hi or a > b:
+            raise ValueError(f"cron field {f!r} out of range")
+        out.update(range(a, b + 1, int(step) if step else 1))
+    return out
+
+def parse_cron(spec):
+    # "minute hour day month weekday", weekday 0-7 with 0 and 7 = Sunday
+    fs = spec.split()
+    if len(fs) != 5:
+        raise ValueError("cron needs 5 fields")
+    try:
+        mins, hours, days, months, wdays = (_cron_field(f, lo, hi) for f, (lo, hi) in
+                                            zip(fs, [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]))
+    except ValueError as e:
+        raise ValueError(f"bad cron {spec!r}: {e}")
+    if 7 in wdays:
+        wdays.add(0)
+    # Like cron: with both day fields restricted, either one matching is enough
+    any_day = fs[2] != "*" and fs[4] != "*"
+    return mins, hours, days, months, wdays, any_day
+
+def next_cron(cron, now):
+    mins, hours, days, months, wdays, any_day = cron
+    t = now.replace(second=0, microsecond=0) + datetime.timedelta(minutes=1)
+    end = t + datetime.timedelta(days=366 * 4)
+    while t < end:
+        dm, wm = t.day in days, (t.weekday() + 1) % 7 in wdays
+        if t.month not in months or not (dm or wm if any_day else dm and wm):
+            t = t.replace(hour=0, minute=0) + datetime.timedelta(days=1)
+        elif t.hour not in hours:
+            t = t.replace(minute=0) + datetime.timedelta(hours=1)
+        elif t.minute not in mins:
+            t += datetime.timedelta(minutes=1)
+        else:
+            return t
+    raise ValueError("cron never matches")
+
+def _trigger(aid, a):
+    # "trigger_enabled": false keeps a schedule in the file without running it
+    on = a.get("trigger_enabled", True)
+    if not isinstance(on, bool):
+        raise ValueError("trigger_enabled must be true or false")
+    if "every" in a:
+        v = a["every"]
+        if isinstance(v, bool) or not isinstance(v, (int, float)) or not v >= EVERY_MIN_SECONDS:
+            raise ValueError(f"every must be at least {EVERY_MIN_SECONDS} seconds")
+        return ("every", v) if on else None
+    if "cron" in a:
+        if not isinstance(a["cron"], str):
+            raise ValueError("cron must be text")
+        c = parse_cron(a["cron"])
+        next_cron(c, datetime.datetime.now())
+        return ("cron", c) if on else None
     return None
 
+def compile_actions(raw):
+    # Whole table or nothing: any invalid action rejects the file
+    if not isinstance(raw, dict):
+        raise ValueError("actions.json must be an object of actions")
+    plans = {}
+    triggers = []
+    for aid, a in raw.items():
+        if not isinstance(a, dict):
+            raise ValueError(f"{aid}: must be an object")
+        if not isinstance(a.get("command", ""), str):
+            raise ValueError(f"{aid}: command must be text")
+        k = a.get("kind")
+        if k not in KINDS:
+            raise ValueError(f"{aid}: unknown kind {k!r}")
+        try:
+            plans[aid] = KINDS[k](aid, a, plans)
+            tr = _trigger(aid, a)
+        except ValueError as e:
+            raise ValueError(f"{aid}: {e}")
+        if tr:
+            triggers.append((aid,) + tr)
+    # Macros may only run existing actions, and never themselves
+    def check(aid, path):
+        for ref in getattr(plans[aid], "refs", ()):
+            if ref not in plans:
+                raise ValueError(f"{aid}: runs unknown action {ref!r}")
+            if ref in path:
+                raise ValueError(f"{aid}: macro loop through {ref!r}")
+            check(ref, path | {ref})
+    for aid in plans:
+        check(aid, {aid})
+    return {"actions": raw, "plans": plans, "commands": CommandIndex(raw), "triggers": triggers}
+
+class Scheduler:
+    """
+    One asyncio loop thread runs macros and timed triggers. Their plugin
+    calls go through a single worker thread, so they run one at a time
+    over the same pooled keep-alive connection to the engine.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.io = ThreadPoolExecutor(max_workers=1)
+        self.tasks = []
+        self.active = False
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+
+    async def call(self, plan):
+        m = getattr(plan, "macro", None)
+        if m:
+            await m()
+            return True
+        return await self.loop.run_in_executor(self.io, plan)
+
+    def _report(self, aid):
+        def done(f):
+            if not f.cancelled() and f.exception():
+                print(f"{aid} failed: {f.exception()}")
+        return done
+
+    def spawn(self, aid, fn):
+        f = asyncio.run_coroutine_threadsafe(fn(), self.loop)
+        f.add_done_callback(self._report(aid))
+        return f
+
+    def set_triggers(self, table):
+        self.active = True
+        self.loop.call_soon_threadsafe(self._arm, table)
+
+    def _arm(self, table):
+        for task in self.tasks:
+            task.cancel()
+        self.tasks = [self.loop.create_task(self._every(aid, v, table["plans"][aid]) if kind == "every"
+                                            else self._cron(aid, v, table["plans"][aid]))
+                      for aid, kind, v in table["triggers"]]
+
+    def _fire(self, aid, plan):
+        # Don't let a slow run push back the next one
+        self.loop.create_task(self.call(plan)).add_done_callback(self._report(aid))
+
+    async def _every(self, aid, interval, plan):
+        # Fixed deadlines, so small delays don't add up over time
+        due = self.loop.time()
+        while True:
+            due += interval
+            await asyncio.sleep(max(0, due - self.loop.time()))
+            self._fire(aid, plan)
+
+    async def _cron(self, aid, cron, plan):
+        while True:
+            due = next_cron(cron, datetime.datetime.now())
+            # Wake at least once a minute in case the clock jumps
+            while True:
+                left = (due - datetime.datetime.now()).total_seconds()
+                if left <= 0:
+                    break
+                await asyncio.sleep(min(left, 60))
+            self._fire(aid, plan)
+
+SCHED = Scheduler()
+TABLE = compile_actions({})
+
+def reload_actions():
+    global TABLE
+    try:
+        t = compile_actions(load_actions())
+    except (OSError, ValueError) as e:
+        # Keep running with the last good table
+        STATE["actions_error"] = str(e)
+        print(f"actions.json rejected: {e}")
+        return False
+    # Swapped as one reference; a request uses whichever table it started with
+    TABLE = t
+    if SCHED.active:
+        SCHED.set_triggers(t)
+    STATE["actions_error"] = None
+    return True
+
+def _mtime():
+    try:
+        return os.stat(ACTIONS_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+def watch_actions():
+    def loop():
+        seen = _mtime()
+        while True:
+            time.sleep(ACTIONS_WATCH_INTERVAL)
+            m = _mtime()
+            if m != seen:
+                seen = m
+                if reload_actions():
+                    print("actions.json reloaded")
+    threading.Thread(target=loop, daemon=True).start()
+
+reload_actions()
+
+def run_action(action_id, t=None):
+    p = (t or TABLE)["plans"].get(action_id)
+    return p() if p else False
+
+def run_command(text):
+    t = TABLE
+    aid, score = t["commands"].match(text)
+    if aid and run_action(aid, t):
+        return aid, score
+    return None, score
+
 class H(BaseHTTPRequestHandler):
     def _json(self, d, c=200):
         b = json.dumps(d).encode("utf-8")
@@ -91,10 +664,10 @@ class H(BaseHTTPRequestHandler):
 
     def do_GET(self):
         if self.path == "/" or self.path == "/index.html":
-            self._file("index.html", "text/html; charset=utf-8")
+            self._file(os.path.join(BASE, "index.html"), "text/html; charset=utf-8")
             return
         if self.path == "/api/actions":
-            self._json(ACTIONS)
+            self._json(TABLE["actions"])
             return
         if self.path == "/api/state":
             self._json(STATE)
@@ -108,14 +681,22 @@ class H(BaseHTTPRequestHandler):
 
         if self.path.startswith("/api/run/"):
             aid = self.path.split("/api/run/")[1]
-            ok = run_action(aid)
+            try:
+                ok = run_action(aid)
+            except PluginError as e:
+                self._json({"ok": False, "action_id": aid, "error": str(e)}, 503)
+                return
             self._json({"ok": ok, "action_id": aid})
             return
 
         if self.path == "/api/voice":
             t = body.get("text", "")
-            m = run_command(t)
-            self._json({"matched": m})
+            try:
+                m, score = run_command(t)
+            except PluginError as e:
+                self._json({"matched": None, "error": str(e)}, 503)
+                return
+            self._json({"matched": m, "confidence": round(score, 3)})
             return
 
         if self.path == "/api/controller/button":
@@ -127,9 +708,166 @@ class H(BaseHTTPRequestHandler):
         self._json({"error": "not_found"}, 404)
 
 def start():
-    s = HTTPServer((HOST, PORT), H)
+    watch_actions()
+    SCHED.set_triggers(TABLE)
+    # One thread per request, so a slow plugin call doesn't hold up others
+    s = ThreadingHTTPServer((HOST, PORT), H)
+    s.daemon_threads = True
     print(f"Camcookie Actions at http://{HOST}:{PORT}")
     s.serve_forever()
 
+def benchmark_match(n=5000):
+    # python3 app.py --benchmark-match
+    import random
+    rng = random.Random(1)
+    # ~500 made-up words, 2-5 per command
+    words = sorted({"".join(rng.choice("abcdefghijklmnoprstuw") for _ in range(rng.randint(3, 9)))
+                    for _ in range(500)})
+    acts = {"lamp_on": {"command": "turn on lamp"}, "lamp_off": {"command": "turn off lamp"}}
+    for i in range(n):
+        acts[f"a{i}"] = {"command": " ".join(rng.sample(words, rng.randint(2, 5)))}
+    t0 = time.perf_counter()
+    idx = CommandIndex(acts)
+    print(f"index {n} commands: {(time.perf_counter() - t0) * 1000:.1f} ms")
+    for q in ["turn on lamp", "Turn on the lamp!", "lamp turn on", "turn on lamb", "tern off lamp", "xyzzy"]:
+        t0 = time.perf_counter()
+        for _ in range(200):
+            r = idx.match(q)
+        ms = (time.perf_counter() - t0) / 200 * 1000
+        print(f"{q!r:<22} -> {r[0]!s:<8} {r[1]:.2f}  {ms:.3f} ms")
+
+def benchmark_macro(steps=1000, interval=0.1, seconds=5.0):
+    # python3 app.py --benchmark-macro  (against a stub plugin engine)
+    hits, conns = [], set()
+
+    class Stub(BaseHTTPRequestHandler):
+        # Same socket settings as the plugin engine's handler
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def log_message(self, *a):
+            pass
+
+        def do_GET(self):
+            hits.append(time.monotonic())
+            conns.add(self.client_address)
+            l = int(self.headers.get("Content-Length", 0))
+            if l:
+                self.rfile.read(l)
+            b = b'{"ok": true}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(b)))
+            self.end_headers()
+            self.wfile.write(b)
+
+        do_POST = do_GET
+
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), Stub)
+    srv.daemon_threads = True
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    PLUGIN.port = srv.server_address[1]
+
+    t = compile_actions({
+        "click": {"kind": "plugin_mouse_click"},
+        "burst": {"kind": "macro", "steps": [{"repeat": steps, "steps": [{"run": "click"}]}]},
+        "fan_out": {"kind": "macro", "steps": [{"parallel": [
+            [{"delay": 0.1}, {"run": "click"}], [{"delay": 0.1}, {"run": "click"}]]}]},
+        "tick": {"kind": "plugin_mouse_click", "every": interval}
+    })
+    t0 = time.perf_counter()
+    SCHED.spawn("burst", t["plans"]["burst"].macro).result()
+    el = time.perf_counter() - t0
+    print(f"macro: {steps} steps in {el * 1000:.0f} ms ({steps / el:.0f} steps/s), "
+          f"{len(conns)} connection(s)")
+
+    t0 = time.perf_counter()
+    SCHED.spawn("fan_out", t["plans"]["fan_out"].macro).result()
+    print(f"parallel: 2 x 100 ms branches in {(time.perf_counter() - t0) * 1000:.0f} ms")
+
+    hits.clear()
+    SCHED.set_triggers(t)
+    time.sleep(seconds)
+    SCHED.set_triggers({"plans": {}, "triggers": []})
+    if not hits:
+        print(f"every {interval * 1000:.0f} ms: 0 runs in {seconds:.1f} s")
+    else:
+        gaps = sorted(abs((h - hits[0]) - i * interval) * 1000 for i, h in enumerate(hits))
+        print(f"every {interval * 1000:.0f} ms: {len(hits)} runs, jitter mean {sum(gaps) / len(gaps):.2f} ms, "
+              f"p99 {gaps[int(len(gaps) * 0.99)]:.2f} ms, max {gaps[-1]:.2f} ms, {len(conns)} connection(s)")
+    srv.shutdown()
+
+def benchmark_load(latency=0.02, seconds=2.0, levels=(1, 2, 4, 8, 16)):
+    # python3 app.py --benchmark-load  (stub plugin engine, `latency` s per call)
+    global TABLE
+    stall = [False]
+
+    class Stub(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def log_message(self, *a):
+            pass
+
+        def do_GET(self):
+            time.sleep(1.0 if stall[0] else latency)
+            b = b'{"ok": true}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(b)))
+            self.end_headers()
+            self.wfile.write(b)
+
+    stub = ThreadingHTTPServer(("127.0.0.1", 0), Stub)
+    stub.daemon_threads = True
+    threading.Thread(target=stub.serve_forever, daemon=True).start()
+    PLUGIN.port = stub.server_address[1]
+    TABLE = compile_actions({"click": {"kind": "plugin_mouse_click"}})
+
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), H)
+    srv.daemon_threads = True
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    H.log_message = lambda *a: None
+
+    def call():
+        c = http.client.HTTPConnection("127.0.0.1", srv.server_address[1], timeout=10)
+        c.request("POST", "/api/run/click")
+        r = c.getresponse()
+        r.read()
+        c.close()
+        return r.status
+
+    print(f"plugin call latency {latency * 1000:.0f} ms, pool of {PLUGIN_POOL_SIZE}")
+    for n in levels:
+        counts = []
+        stop = time.monotonic() + seconds
+        def client():
+            k = 0
+            while time.monotonic() < stop:
+                call()
+                k += 1
+            counts.append(k)
+        ts = [threading.Thread(target=client) for _ in range(n)]
+        for t in ts:
+            t.start()
+        for t in ts:
+            t.join()
+        print(f"{n:>3} clients: {sum(counts) / seconds:7.0f} req/s")
+
+    stall[0] = True
+    PLUGIN.timeout = 0.2
+    print("plugin engine stalled (timeout 200 ms):")
+    for i in range(5):
+        t0 = time.perf_counter()
+        status = call()
+        print(f"  call {i + 1}: {status} in {(time.perf_counter() - t0) * 1000:.0f} ms")
+
 if __name__ == "__main__":
-    start()
\ No newline at end of file
+    if "--benchmark-load" in sys.argv:
+        benchmark_load()
+    elif "--benchmark-match" in sys.argv:
+        benchmark_match()
+    elif "--benchmark-macro" in sys.argv:
+        benchmark_macro()
+    else:
+        start()
\ No newline at end of file
@@ -1,11 +1,20 @@
 #!/usr/bin/env python3
+import sys
 import time
+import math
+import random
+from array import array
 import threading
 import serial
 import serial.tools.list_ports
 import uinput
+import heapq
 import json
 import os
+import selectors
+import socketserver
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from urllib.parse import urlparse, parse_qs
 import requests
@@ -17,10 +26,47 @@ HOME = os.path.expanduser("~")
 INSTALLED_FILE = os.path.join(HOME, ".camcookie_installed.json")
 CONNECTED_FILE = os.path.join(HOME, ".camcookie_connected.json")
 APPSTORE_URL = "https://camcookie876.github.io/PI/appstore/appstore.json"
+# Small versioned index (no install scripts); enough for the plugin UI
+CATALOG_INDEX_URL = "https://camcookie876.github.io/PI/appstore/catalog/index.json"
+
+CATALOG_TTL_SECONDS = 300
 
 HTTP_HOST = "127.0.0.1"
 HTTP_PORT = 8765
+# Worker threads serving HTTP requests; 1 keeps the old single-threaded server
+HTTP_WORKERS = int(os.environ.get("CAMCOOKIE_PLUGIN_WORKERS", "16"))
+# Idle keep-alive connections are closed after this, freeing their worker
+HTTP_IDLE_TIMEOUT_SECONDS = 5
+MAX_BATCH_OPS = 256
+STREAM_PORT = 8766
+# /events pushes at most this often and re-checks state at least this often
+EVENTS_MIN_INTERVAL_SECONDS = 0.2
+EVENTS_CHECK_INTERVAL_SECONDS = 1.0
+EVENTS_HEARTBEAT_SECONDS = 15
+# Open /events streams allowed at once; always fewer than HTTP_WORKERS, since
+# each stream holds a worker for as long as it is open
+EVENTS_MAX_SUBSCRIBERS = 4
 SHUTDOWN_DELAY_SECONDS = 5
+# Arduino mouse motion: emit rate, acceleration curve (see ACCEL_CURVES) and
+# smoothing (0 = emit input as it arrives, closer to 1 = spread over more ticks)
+ARDUINO_TICK_HZ = 250
+ARDUINO_ACCEL_CURVE = "flat"
+ARDUINO_SMOOTHING = 0.3
+# Serial link: v2 sketches run at ARDUINO_BAUD and switch to binary frames
+# after the handshake; v1 sketches only speak text at ARDUINO_LEGACY_BAUD
+ARDUINO_BAUD = 115200
+ARDUINO_LEGACY_BAUD = 9600
+ARDUINO_HANDSHAKE_SECONDS = 3
+# How often a lost device is looked for again
+ARDUINO_REDETECT_SECONDS = 2
+DEVICE_READ_CHUNK = 4096
+STATE_FLUSH_DELAY_SECONDS = 0.5
+STATE_WATCH_INTERVAL_SECONDS = 1.0
+# Temperature: sampling cadence, samples kept (one hour at 2 s) and the
+# sensor source ("fixed" until real hardware lands, or "simulated")
+TEMP_SAMPLE_INTERVAL_SECONDS = 2.0
+TEMP_HISTORY_SIZE = 1800
+TEMP_SENSOR = os.environ.get("CAMCOOKIE_TEMP_SENSOR", "fixed")
 
 
 # ============================================================
@@ -33,19 +79,126 @@ class MouseController:
             uinput.REL_Y,
             uinput.BTN_LEFT,
         ])
+        # HTTP workers and the Arduino thread share one device
+        self.lock = threading.Lock()
 
     def move(self, dx, dy):
-        self.device.emit(uinput.REL_X, dx)
-        self.device.emit(uinput.REL_Y, dy)
+        # One SYN for both axes so diagonal moves land as a single report
+        with self.lock:
+            self.device.emit(uinput.REL_X, dx, syn=False)
+            self.device.emit(uinput.REL_Y, dy)
 
     def click(self):
-        self.device.emit(uinput.BTN_LEFT, 1)
-        self.device.emit(uinput.BTN_LEFT, 0)
+        with self.lock:
+            self.device.emit(uinput.BTN_LEFT, 1)
+            self.device.emit(uinput.BTN_LEFT, 0)
 
 
 MOUSE = MouseController()
 
 
+# ============================================================
+#  Mouse motion pipeline (device-driven input)
+# ============================================================
+ACCEL_CURVES = {
+    "flat": lambda speed: 1.0,
+    "linear": lambda speed: 1.0 + speed / 10.0,
+    "quadratic": lambda speed: 1.0 + (speed / 10.0) ** 2,
+}
+
+
+class MotionPipeline:
+    """
+    Collects raw deltas from a device reader and emits them to the mouse
+    on a fixed-rate tick, independent of when input arrives.
+
+    Everything pushed between two ticks becomes one move. Acceleration is
+    applied per input delta; smoothing spreads the accumulated backlog
+    over several ticks without losing distance. Ticks run as timers on
+    the device reactor and stop while there is nothing left to emit.
+    """
+
+    def __init__(self, mouse, reactor=None, tick_hz=ARDUINO_TICK_HZ,
+                 curve=ARDUINO_ACCEL_CURVE, smoothing=ARDUINO_SMOOTHING):
+        self.mouse = mouse
+        self.reactor = reactor or REACTOR
+        self.interval = 1.0 / tick_hz
+        self.curve = ACCEL_CURVES.get(curve, ACCEL_CURVES["flat"])
+        self.smoothing = min(max(smoothing, 0.0), 0.95)
+        self.lock = threading.Lock()
+        self.backlog_x = 0.0
+        self.backlog_y = 0.0
+        self.clicks = 0
+        self.running = False
+        self.scheduled = False
+        # Bumped by stop() so ticks queued before it are dropped
+        self.generation = 0
+
+    def push(self, dx, dy):
+        gain = self.curve((dx * dx + dy * dy) ** 0.5)
+        with self.lock:
+            self.backlog_x += dx * gain
+            self.backlog_y += dy * gain
+        self._kick()
+
+    def click(self):
+        with self.lock:
+            self.clicks += 1
+        self._kick()
+
+    def _kick(self):
+        with self.lock:
+            if self.scheduled or not self.running:
+                return
+            self.scheduled = True
+            generation = self.generation
+        self.reactor.schedule(0, lambda: self._on_tick(generation))
+
+    def _on_tick(self, generation):
+        with self.lock:
+            if generation != self.generation:
+                return
+            if not self.running:
+                self.scheduled = False
+                return
+        if self.tick():
+            self.reactor.schedule(self.interval, lambda: self._on_tick(generation))
+
+    def start(self):
+        self.running = True
+
+    def stop(self):
+        with self.lock:
+            self.running = False
+            self.scheduled = False
+            self.generation += 1
+            self.backlog_x = self.backlog_y = 0.0
+            self.clicks = 0
+
+    def tick(self):
+        """Emit one tick's worth of motion; returns False once idle."""
+        with self.lock:
+            step_x = int(self.backlog_x * (1.0 - self.smoothing))
+            step_y = int(self.backlog_y * (1.0 - self.smoothing))
+            # Drain leftovers that smoothing alone would never reach
+            if step_x == 0 and abs(self.backlog_x) >= 1:
+                step_x = int(self.backlog_x / abs(self.backlog_x))
+            if step_y == 0 and abs(self.backlog_y) >= 1:
+                step_y = int(self.backlog_y / abs(self.backlog_y))
+            self.backlog_x -= step_x
+            self.backlog_y -= step_y
+            clicks, self.clicks = self.clicks, 0
+            busy = abs(self.backlog_x) >= 1 or abs(self.backlog_y) >= 1
+            # Input arriving after this point schedules a fresh tick
+            self.scheduled = busy
+
+        if step_x or step_y:
+            self.mouse.move(step_x, step_y)
+        for _ in range(clicks):
+            self.mouse.click()
+        return busy
+
+
 # ============================================================
 #  Plugin Base
 # ============================================================
@@ -80,20 +233,258 @@ class BasePlugin:
 class EngineState:
     def __init__(self):
         self.arduino_data = "None"
+        # Bumped on every state change so /events listeners wake up
+        self.version = 0
+        self.changed = threading.Condition()
+
+    def notify_changed(self):
+        with self.changed:
+            self.version += 1
+            self.changed.notify_all()
+
+    def wait_for_change(self, version, timeout):
+        with self.changed:
+            self.changed.wait_for(lambda: self.version != version, timeout)
+            return self.version
 
 
 STATE = EngineState()
 
 
+# ============================================================
+#  Device I/O reactor
+# ============================================================
+class DeviceReactor:
+    """
+    One thread that waits on every device file descriptor with selectors
+    and hands each read to its owner, instead of one blocking reader
+    thread per device.
+
+    on_data(data) runs on the reactor thread and must not block; reads are
+    at most DEVICE_READ_CHUNK bytes per wake-up, so a busy device cannot
+    starve the others. on_lost() is called once (and the device removed)
+    when a read fails or hits EOF, e.g. the device was unplugged.
+    schedule() runs one-shot callbacks on the same thread.
+    """
+
+    def __init__(self):
+        self.selector = selectors.DefaultSelector()
+        self.lock = threading.Lock()
+        self.pending = []
+        self.timers = []
+        self.timer_seq = 0
+        self.thread = None
+        self.wake_r, self.wake_w = os.pipe()
+        os.set_blocking(self.wake_r, False)
+        self.selector.register(self.wake_r, selectors.EVENT_READ, None)
+
+    def _submit(self, op, wait):
+        done = threading.Event()
+        with self.lock:
+            self.pending.append((op, done))
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, daemon=True)
+                self.thread.start()
+        os.write(self.wake_w, b"x")
+        if wait and threading.current_thread() is not self.thread:
+            done.wait(timeout=1)
+
+    def add(self, fileobj, on_data, on_lost):
+        fd = fileobj.fileno()
+        os.set_blocking(fd, False)
+        self._submit(lambda: self.selector.register(fd, selectors.EVENT_READ,
+                                                    (on_data, on_lost)), wait=True)
+
+    def remove(self, fileobj):
+        fd = fileobj.fileno()
+
+        def unregister():
+            if fd in self.selector.get_map():
+                self.selector.unregister(fd)
+        # Waits, so the caller can close the device right after
+        self._submit(unregister, wait=True)
+
+    def schedule(self, delay, callback):
+        def push():
+            self.timer_seq += 1
+            heapq.heappush(self.timers, (time.monotonic() + delay, self.timer_seq, callback))
+        self._submit(push, wait=False)
+
+    def _run(self):
+        while True:
+            with self.lock:
+                pending, self.pending = self.pending, []
+            for op, done in pending:
+                try:
+                    op()
+                except Exception:
+                    pass
+                done.set()
+
+            timeout = None
+            if self.timers:
+                timeout = max(0.0, self.timers[0][0] - time.monotonic())
+            for key, _ in self.selector.select(timeout):
+                if key.data is None:
+                    try:
+                        os.read(self.wake_r, 512)
+                    except BlockingIOError:
+                        pass
+                    continue
+                on_data, on_lost = key.data
+                try:
+                    data = os.read(key.fd, DEVICE_READ_CHUNK)
+                except BlockingIOError:
+                    continue
+                except OSError:
+                    data = b""
+                if not data:
+                    self.selector.unregister(key.fd)
+                    self._safe_call(on_lost)
+                    continue
+                self._safe_call(on_data, data)
+
+            now = time.monotonic()
+            while self.timers and self.timers[0][0] <= now:
+                _, _, callback = heapq.heappop(self.timers)
+                self._safe_call(callback)
+
+    def _safe_call(self, callback, *args):
+        try:
+            callback(*args)
+        except Exception:
+            pass
+
+
+REACTOR = DeviceReactor()
+
+
+# ============================================================
+#  Arduino serial protocols
+# ============================================================
+# Both parsers take raw bytes in any chunking and return events as
+# ("MOVE", dx, dy) or ("CLICK", 0, 0).
+class AsciiFrameParser:
+    """v1 text protocol: "MOVE dx dy" and "CLICK" lines."""
+
+    name = "text"
+    MAX_LINE = 64
+
+    def __init__(self):
+        self.buffer = b""
+
+    def feed(self, data):
+        *lines, self.buffer = (self.buffer + data).split(b"\n")
+        if len(self.buffer) > self.MAX_LINE:
+            self.buffer = b""
+        events = []
+        for raw in lines:
+            parts = raw.split()
+            if not parts:
+                continue
+            if parts[0] == b"MOVE" and len(parts) == 3:
+                try:
+                    events.append(("MOVE", int(parts[1]), int(parts[2])))
+                except ValueError:
+                    continue
+            elif parts[0] == b"CLICK":
+                events.append(("CLICK", 0, 0))
+        return events
+
+
+class BinaryFrameParser:
+    """
+    v2 binary protocol, 6-byte frames:
+
+        0xA5, type (1 = move, 2 = click), seq, dx, dy, type ^ seq ^ dx ^ dy
+
+    dx/dy are signed bytes. Frames with a bad checksum are skipped by
+    resyncing on the next 0xA5; gaps in seq are counted as dropped.
+    """
+
+    name = "binary"
+    SYNC = 0xA5
+    FRAME_SIZE = 6
+    TYPES = {1: "MOVE", 2: "CLICK"}
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.last_seq = None
+        self.dropped = 0
+        self.corrupt = 0
+
+    def feed(self, data):
+        buf = self.buffer
+        buf += data
+        events = []
+        i = 0
+        end = len(buf) - self.FRAME_SIZE
+        while i <= end:
+            if buf[i] != self.SYNC:
+                i += 1
+                continue
+            kind, seq, dx, dy, check = buf[i + 1:i + 6]
+            if kind ^ seq ^ dx ^ dy != check or kind not in self.TYPES:
+                self.corrupt += 1
+                i += 1
+                continue
+            if self.last_seq is not None:
+                self.dropped += (seq - self.last_seq - 1) % 256
+            self.last_seq = seq
+            events.append((self.TYPES[kind],
+                           dx - 256 if dx > 127 else dx,
+                           dy - 256 if dy > 127 else dy))
+            i += self.FRAME_SIZE
+        del buf[:i]
+        return events
+
+
+def open_arduino_serial(port):
+    """
+    Open the Arduino port and pick a protocol. A v2 sketch answers
+    "PROTO 2" with "PROTO 2 OK" and switches to binary frames; anything
+    else falls back to the text protocol (at 9600 baud if nothing readable
+    arrived at the higher rate). Returns (serial_port, parser).
+    """
+    ser = serial.Serial(port, ARDUINO_BAUD, timeout=0.25)
+    saw_text = False
+    # Opening the port resets most boards, so keep asking until it boots
+    deadline = time.monotonic() + ARDUINO_HANDSHAKE_SECONDS
+    while time.monotonic() < deadline:
+        ser.write(b"PROTO 2\n")
+        line = ser.readline().strip()
+        if line == b"PROTO 2 OK":
+            ser.timeout = 1
+            return ser, BinaryFrameParser()
+        if line.startswith((b"MOVE", b"CLICK")):
+            saw_text = True
+
+    if saw_text:
+        ser.timeout = 1
+        return ser, AsciiFrameParser()
+    ser.close()
+    return serial.Serial(port, ARDUINO_LEGACY_BAUD, timeout=1), AsciiFrameParser()
+
+
 # ============================================================
 #  Arduino Mouse Plugin
 # ============================================================
 class ArduinoMousePlugin(BasePlugin):
+    """
+    Reads the Arduino over serial. The handshake waits for the board to
+    boot (up to ARDUINO_HANDSHAKE_SECONDS), so it runs on its own thread
+    without the manager lock; only publishing the open port takes it.
+    Every start()/stop() bumps `attempt`, so a handshake that finishes
+    after the plugin was toggled closes its port instead of using it.
+    """
+
     def __init__(self, manager):
         super().__init__(manager, "arduino_mouse", "Arduino Mouse")
-        self.running = False
-        self.thread = None
         self.serial_port = None
+        self.parser = None
+        self.pipeline = MotionPipeline(MOUSE)
+        self.connecting = False
+        self.attempt = 0
 
     def find_arduino(self):
         ports = serial.tools.list_ports.comports()
@@ -103,49 +494,97 @@ class ArduinoMousePlugin(BasePlugin):
         return None
 
     def start(self):
-        if self.enabled:
+        if self.enabled or self.connecting:
             return
         port = self.find_arduino()
         if not port:
             self.status = "Arduino not found"
             return
+        self.attempt += 1
+        self.connecting = True
+        self.status = f"Connecting on {port}..."
+        threading.Thread(target=self._connect, args=(port, self.attempt), daemon=True).start()
 
+    def _connect(self, port, attempt):
+        """Handshake off the lock, then publish the port if `attempt` is still current."""
         try:
-            self.serial_port = serial.Serial(port, 9600, timeout=1)
-            self.running = True
-            self.thread = threading.Thread(target=self._loop, daemon=True)
-            self.thread.start()
-            self.enabled = True
-            self.status = f"Connected on {port}"
+            serial_port, parser = open_arduino_serial(port)
         except Exception as e:
-            self.status = f"Error: {e}"
+            with self.manager.lock:
+                if attempt != self.attempt:
+                    return
+                self.status = f"Error: {e}"
+                if self.connecting:
+                    self.connecting = False
+                else:
+                    REACTOR.schedule(ARDUINO_REDETECT_SECONDS, self._redetect)
+            STATE.notify_changed()
+            return
 
-    def _loop(self):
-        while self.running:
+        with self.manager.lock:
+            current = attempt == self.attempt
+            if current:
+                self.serial_port, self.parser = serial_port, parser
+                REACTOR.add(serial_port, self._on_data, self._on_lost)
+                self.status = f"Connected on {port} ({parser.name}, {serial_port.baudrate} baud)"
+                if self.connecting:
+                    self.connecting = False
+                    self.pipeline.start()
+                    self.enabled = True
+        if not current:
             try:
-                line = self.serial_port.readline().decode(errors="ignore").strip()
-                if not line:
-                    continue
+                serial_port.close()
+            except Exception:
+                pass
+            return
+        STATE.notify_changed()
+
+    def handle_events(self, events):
+        for kind, dx, dy in events:
+            if kind == "MOVE":
+                self.pipeline.push(max(min(dx, 20), -20), max(min(dy, 20), -20))
+            elif kind == "CLICK":
+                self.pipeline.click()
+        if events:
+            kind, dx, dy = events[-1]
+            STATE.arduino_data = f"MOVE {dx} {dy}" if kind == "MOVE" else kind
+            STATE.notify_changed()
+
+    def _on_data(self, data):
+        self.handle_events(self.parser.feed(data))
+
+    def _on_lost(self):
+        self._close_port()
+        if self.enabled:
+            self.status = "Arduino disconnected, waiting for it to come back"
+            STATE.notify_changed()
+            REACTOR.schedule(ARDUINO_REDETECT_SECONDS, self._redetect)
 
-                STATE.arduino_data = line
+    def _redetect(self):
+        if not self.enabled:
+            return
+        port = self.find_arduino()
+        if not port:
+            REACTOR.schedule(ARDUINO_REDETECT_SECONDS, self._redetect)
+            return
+        # The handshake waits for the board to boot; keep it off the reactor
+        threading.Thread(target=self._connect, args=(port, self.attempt), daemon=True).start()
 
-                parts = line.split()
-                if parts[0] == "MOVE" and len(parts) == 3:
-                    dx = max(min(int(parts[1]), 20), -20)
-                    dy = max(min(int(parts[2]), 20), -20)
-                    MOUSE.move(dx, dy)
-                elif parts[0] == "CLICK":
-                    MOUSE.click()
+    def _close_port(self):
+        port, self.serial_port = self.serial_port, None
+        if port:
+            REACTOR.remove(port)
+            try:
+                port.close()
             except Exception:
-                time.sleep(0.05)
+                pass
 
     def stop(self):
-        self.running = False
-        if self.thread:
-            self.thread.join(timeout=1)
-        if self.serial_port:
-            self.serial_port.close()
+        self.attempt += 1
+        self.connecting = False
         self.enabled = False
+        self._close_port()
+        self.pipeline.stop()
         self.status = "Disabled"
 
 
@@ -173,23 +612,171 @@ class LedPlugin(BasePlugin):
 # ============================================================
 #  Temperature Plugin (stub, ready for future sensor)
 # ============================================================
+class FixedTempSensor:
+    """Placeholder until a real sensor is wired up."""
+
+    def read(self):
+        return 22.5
+
+
+class SimulatedTempSensor:
+    """
+    Slow drift plus noise around `base`, for testing without hardware.
+    `delay` makes each read take that long, like a slow 1-Wire sensor.
+    """
+
+    def __init__(self, base=22.5, swing=1.5, period=600.0, noise=0.2, delay=0.0, seed=None):
+        self.base = base
+        self.swing = swing
+        self.period = period
+        self.noise = noise
+        self.delay = delay
+        self.rng = random.Random(seed)
+
+    def read(self):
+        if self.delay:
+            time.sleep(self.delay)
+        phase = 2 * math.pi * (time.time() % self.period) / self.period
+        return round(self.base + self.swing * math.sin(phase) + self.rng.gauss(0, self.noise), 2)
+
+
+TEMP_SENSORS = {
+    "fixed": FixedTempSensor,
+    "simulated": SimulatedTempSensor,
+}
+
+
+class TempHistory:
+    """
+    Fixed-size ring buffer of (timestamp, value) samples in two flat
+    float arrays; the oldest sample is overwritten once it's full.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.times = array("d", bytes(8 * size))
+        self.values = array("d", bytes(8 * size))
+        self.next = 0
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def add(self, t, value):
+        with self.lock:
+            self.times[self.next] = t
+            self.values[self.next] = value
+            self.next = (self.next + 1) % self.size
+            self.count = min(self.count + 1, self.size)
+
+    def latest(self):
+        with self.lock:
+            if not self.count:
+                return None
+            i = (self.next - 1) % self.size
+            return self.times[i], self.values[i]
+
+    def windows(self, seconds, points, now=None):
+        """
+        Samples from the last `seconds`, split into `points` equal
+        windows, each as {t, min, max, avg, count}. Empty windows are
+        left out.
+        """
+        now = time.time() if now is None else now
+        start = now - seconds
+        width = seconds / points
+        buckets = [None] * points
+        with self.lock:
+            first = (self.next - self.count) % self.size
+            for k in range(self.count):
+                i = (first + k) % self.size
+                t = self.times[i]
+                if t < start:
+                    continue
+                b = min(int((t - start) / width), points - 1)
+                v = self.values[i]
+                w = buckets[b]
+                if w is None:
+                    buckets[b] = [v, v, v, 1]
+                else:
+                    w[0] = min(w[0], v)
+                    w[1] = max(w[1], v)
+                    w[2] += v
+                    w[3] += 1
+        return [
+            {"t": round(start + b * width, 3), "min": w[0], "max": w[1],
+             "avg": round(w[2] / w[3], 3), "count": w[3]}
+            for b, w in enumerate(buckets) if w is not None
+        ]
+
+
 class TempPlugin(BasePlugin):
-    def __init__(self, manager):
+    """
+    Samples the sensor on its own thread every TEMP_SAMPLE_INTERVAL_SECONDS
+    while enabled, so reads never wait on the hardware; they return the
+    newest sample. Samples also go into a ring buffer for /temp/history.
+    """
+
+    def __init__(self, manager, sensor=None, interval=TEMP_SAMPLE_INTERVAL_SECONDS,
+                 history_size=TEMP_HISTORY_SIZE):
         super().__init__(manager, "temp", "Temperature Sensor")
+        self.sensor = sensor or TEMP_SENSORS.get(TEMP_SENSOR, FixedTempSensor)()
+        self.interval = interval
+        self.history = TempHistory(history_size)
         self.current_temp = None
+        self.sample_lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = None
 
     def start(self):
         self.enabled = True
         self.status = "Ready (no sensor connected yet)"
+        if self.thread is not None and self.thread.is_alive() and not self.stopped.is_set():
+            return
+        # A new thread with its own stop event: a sampler stopped during a
+        # slow read may still be finishing, and exits on the old event
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._sample_loop, args=(self.stopped,), daemon=True)
+        self.thread.start()
 
     def stop(self):
         self.enabled = False
         self.status = "Disabled"
+        self.stopped.set()
+
+    def _sample_loop(self, stopped):
+        # Fixed deadlines, so a slow read doesn't stretch the cadence
+        due = time.monotonic()
+        while not stopped.is_set():
+            try:
+                self.sample()
+            except Exception as e:
+                self.status = f"Sensor error: {e}"
+            due += self.interval
+            now = time.monotonic()
+            if due < now:
+                due = now
+            stopped.wait(due - now)
+
+    def sample(self):
+        # One sensor read at a time, whether from the loop or a cold read
+        with self.sample_lock:
+            value = self.sensor.read()
+            self.history.add(time.time(), value)
+        changed = value != self.current_temp
+        self.current_temp = value
+        if self.enabled:
+            self.status = f"{value} °C"
+            if changed:
+                STATE.notify_changed()
+        return value
 
     def read_temp(self):
-        self.current_temp = 22.5
-        self.status = f"{self.current_temp} °C"
-        return self.current_temp
+        latest = self.history.latest()
+        if self.enabled and latest is not None:
+            return latest[1]
+        # Not sampling: read the sensor, at most once per interval
+        if latest is None or time.time() - latest[0] >= self.interval:
+            return self.sample()
+        return latest[1]
 
 
 # ============================================================
@@ -198,22 +785,30 @@ class TempPlugin(BasePlugin):
 class PluginManager:
     def __init__(self):
         self.plugins = {}
+        # Serializes start/stop so concurrent toggles can't race a plugin
+        self.lock = threading.RLock()
 
     def register(self, plugin):
-        self.plugins[plugin.id] = plugin
+        with self.lock:
+            self.plugins[plugin.id] = plugin
 
     def get_plugins_state(self):
-        return [p.to_dict() for p in self.plugins.values()]
+        with self.lock:
+            return [p.to_dict() for p in self.plugins.values()]
 
     def enable_plugin(self, plugin_id):
-        plugin = self.plugins.get(plugin_id)
-        if plugin:
-            plugin.start()
+        with self.lock:
+            plugin = self.plugins.get(plugin_id)
+            if plugin:
+                plugin.start()
+        STATE.notify_changed()
 
     def disable_plugin(self, plugin_id):
-        plugin = self.plugins.get(plugin_id)
-        if plugin:
-            plugin.stop()
+        with self.lock:
+            plugin = self.plugins.get(plugin_id)
+            if plugin:
+                plugin.stop()
+        STATE.notify_changed()
 
     def get_plugin(self, plugin_id):
         return self.plugins.get(plugin_id)
@@ -233,32 +828,241 @@ def load_json_file(path, default):
 
 
 def save_json_file(path, data):
+    # Write to a temp file and rename so readers never see torn JSON
+    tmp_path = f"{path}.tmp.{os.getpid()}.{threading.get_ident()}"
     try:
-        with open(path, "w") as f:
+        with open(tmp_path, "w") as f:
             json.dump(data, f, indent=4)
+        os.replace(tmp_path, path)
     except Exception:
-        pass
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+class JsonFileStore:
+    """
+    Authoritative in-memory copy of a small JSON dict file.
+
+    Requests read and update the dict without touching the disk. Writes
+    are coalesced and flushed shortly afterwards (write-behind) through
+    save_json_file(); edits made by other programs are picked up by
+    reload_if_changed(), which compares the file's mtime.
+    """
+
+    def __init__(self, path, flush_delay=STATE_FLUSH_DELAY_SECONDS):
+        self.path = path
+        self.flush_delay = flush_delay
+        self.lock = threading.RLock()
+        self.data = {}
+        self.mtime = None
+        self.dirty = False
+        self.flush_timer = None
+        self.reload()
+
+    def _file_mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def reload(self):
+        with self.lock:
+            mtime = self._file_mtime()
+            if mtime is None:
+                data = {}
+            else:
+                try:
+                    with open(self.path, "r") as f:
+                        data = json.load(f)
+                except (OSError, ValueError):
+                    data = None
+                if not isinstance(data, dict):
+                    # Probably caught mid-write (the appstore doesn't write
+                    # atomically): keep the old contents and leave mtime
+                    # alone, so the next reload_if_changed() tries again
+                    return False
+            self.data = data
+            self.mtime = mtime
+        STATE.notify_changed()
+        return True
+
+    def reload_if_changed(self):
+        with self.lock:
+            # Local changes not yet flushed win over the file on disk
+            if self.dirty:
+                return False
+            if self._file_mtime() == self.mtime:
+                return False
+            return self.reload()
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.data)
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def set(self, key, value):
+        with self.lock:
+            self.data[key] = value
+            self._mark_dirty()
+            return dict(self.data)
+
+    def replace(self, data):
+        with self.lock:
+            self.data = dict(data)
+            self._mark_dirty()
+
+    def _mark_dirty(self):
+        STATE.notify_changed()
+        self.dirty = True
+        if self.flush_timer is None:
+            self.flush_timer = threading.Timer(self.flush_delay, self.flush)
+            self.flush_timer.daemon = True
+            self.flush_timer.start()
+
+    def flush(self):
+        with self.lock:
+            if self.flush_timer is not None:
+                self.flush_timer.cancel()
+                self.flush_timer = None
+            if not self.dirty:
+                return
+            save_json_file(self.path, self.data)
+            self.mtime = self._file_mtime()
+            self.dirty = False
+
+
+INSTALLED_APPS = JsonFileStore(INSTALLED_FILE)
+CONNECTED_APPS = JsonFileStore(CONNECTED_FILE)
+
+
+def watch_state_files():
+    def worker():
+        while True:
+            time.sleep(STATE_WATCH_INTERVAL_SECONDS)
+            INSTALLED_APPS.reload_if_changed()
+            CONNECTED_APPS.reload_if_changed()
+    t = threading.Thread(target=worker, daemon=True)
+    t.start()
+
+
+def flush_state():
+    CONNECTED_APPS.flush()
 
 
 def load_installed_apps():
-    return load_json_file(INSTALLED_FILE, {})
+    return INSTALLED_APPS.snapshot()
 
 
 def load_connected_apps():
-    return load_json_file(CONNECTED_FILE, {})
+    return CONNECTED_APPS.snapshot()
 
 
 def save_connected_apps(data):
-    save_json_file(CONNECTED_FILE, data)
+    CONNECTED_APPS.replace(data)
+
+
+# ============================================================
+#  Appstore catalog cache
+# ============================================================
+class CatalogCache:
+    """
+    In-memory copy of the Appstore catalog.
+
+    Reads never touch the network: once the TTL runs out the stale copy
+    keeps being served while a background thread revalidates it with
+    ETag / If-Modified-Since. Plugin-enabled app ids are kept in a set
+    so permission checks are a single lookup.
+
+    Only the catalog index is downloaded; it has every field the plugin
+    needs. fallback_url (the full appstore.json) is used if the index
+    isn't published.
+    """
+
+    def __init__(self, url, ttl, fallback_url=None):
+        self.url = url
+        self.fallback_url = fallback_url
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.data = {"apps": []}
+        self.plugin_ids = frozenset()
+        # url -> (ETag, Last-Modified); the index and the fallback each
+        # get their own, so one's validators are never sent to the other
+        self.validators = {}
+        self.fetched_at = 0.0
+        self.refreshing = False
+
+    def get(self):
+        self._refresh_if_stale()
+        return self.data
+
+    def is_plugin_app(self, app_id):
+        self._refresh_if_stale()
+        return app_id in self.plugin_ids
+
+    def _refresh_if_stale(self):
+        if time.monotonic() - self.fetched_at < self.ttl:
+            return
+        self.refresh_async()
+
+    def refresh_async(self):
+        with self.lock:
+            if self.refreshing:
+                return
+            self.refreshing = True
+        t = threading.Thread(target=self.refresh, daemon=True)
+        t.start()
+
+    def _conditional_get(self, url):
+        etag, last_modified = self.validators.get(url, (None, None))
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return requests.get(url, headers=headers, timeout=5)
+
+    def refresh(self):
+        try:
+            url = self.url
+            r = self._conditional_get(url)
+            if r.status_code == 404 and self.fallback_url:
+                url = self.fallback_url
+                r = self._conditional_get(url)
+            if r.status_code == 304:
+                self.fetched_at = time.monotonic()
+                return
+            r.raise_for_status()
+            data = r.json()
+            plugin_ids = frozenset(
+                app.get("id") for app in data.get("apps", [])
+                if app.get("plugin") == "YES"
+            )
+            # Swap both references together; readers never see a half update
+            with self.lock:
+                self.data = data
+                self.plugin_ids = plugin_ids
+                self.validators[url] = (r.headers.get("ETag"), r.headers.get("Last-Modified"))
+                self.fetched_at = time.monotonic()
+        except Exception:
+            # Keep serving the last good copy; try again after a short pause
+            self.fetched_at = time.monotonic() - self.ttl + 10
+        finally:
+            with self.lock:
+                self.refreshing = False
+
+
+CATALOG = CatalogCache(CATALOG_INDEX_URL, CATALOG_TTL_SECONDS, APPSTORE_URL)
 
 
 def load_appstore_json():
-    try:
-        r = requests.get(APPSTORE_URL, timeout=5)
-        r.raise_for_status()
-        return r.json()
-    except Exception:
-        return {"apps": []}
+    return CATALOG.get()
 
 
 def get_connectable_apps():
@@ -282,28 +1086,30 @@ def get_connectable_apps():
     return apps
 
 
+def get_status():
+    return {
+        "plugins": plugin_manager.get_plugins_state(),
+        "arduino_data": STATE.arduino_data,
+        "connectable_apps": get_connectable_apps(),
+        "connected_apps": load_connected_apps()
+    }
+
+
 def count_connected_apps():
-    connected = load_connected_apps()
-    return sum(1 for v in connected.values() if v)
+    return sum(1 for v in CONNECTED_APPS.snapshot().values() if v)
 
 
 # ============================================================
 #  Permission checks
 # ============================================================
 def app_is_allowed(app_id):
-    installed = load_installed_apps()
-    if app_id not in installed:
+    if app_id not in INSTALLED_APPS:
         return False
 
-    store = load_appstore_json()
-    for app in store.get("apps", []):
-        if app.get("id") == app_id and app.get("plugin") == "YES":
-            break
-    else:
+    if not CATALOG.is_plugin_app(app_id):
         return False
 
-    connected = load_connected_apps()
-    return bool(connected.get(app_id, False))
+    return bool(CONNECTED_APPS.get(app_id, False))
 
 
 # ============================================================
@@ -318,12 +1124,59 @@ def schedule_shutdown_if_last():
         time.sleep(SHUTDOWN_DELAY_SECONDS)
         with shutdown_lock:
             if count_connected_apps() == 0:
+                flush_state()
                 os._exit(0)
     t = threading.Thread(target=worker, daemon=True)
     t.start()
 
 
+def run_plugin_op(op):
+    """Run one /batch operation; same limits as the matching GET endpoint."""
+    kind = op.get("op")
+    try:
+        if kind == "move":
+            dx = max(min(int(op.get("dx", 0)), 50), -50)
+            dy = max(min(int(op.get("dy", 0)), 50), -50)
+            MOUSE.move(dx, dy)
+            return {"ok": True}
+
+        if kind == "click":
+            MOUSE.click()
+            return {"ok": True}
+
+        if kind == "led":
+            led = plugin_manager.get_plugin("led")
+            if not led:
+                return {"ok": False, "error": "LED plugin not found"}
+            led.set_led(op.get("on") in (1, "1", True))
+            return {"ok": True}
+
+        if kind == "temp":
+            temp = plugin_manager.get_plugin("temp")
+            if not temp:
+                return {"ok": False, "error": "Temp plugin not found"}
+            return {"ok": True, "temp": temp.read_temp()}
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
+
+    return {"ok": False, "error": f"Unknown op: {kind}"}
+
+
 class CamcookieRequestHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps connections open between requests (every response
+    # carries a Content-Length)
+    protocol_version = "HTTP/1.1"
+    timeout = HTTP_IDLE_TIMEOUT_SECONDS
+    # Headers and body go out as separate writes; without this, Nagle plus
+    # delayed ACKs add ~40 ms to every reply on a reused connection
+    disable_nagle_algorithm = True
+
+    def end_headers(self):
+        # A single-threaded server can't let one client hold the connection
+        if not getattr(self.server, "keep_alive", False):
+            self.send_header("Connection", "close")
+        super().end_headers()
+
     def _send_json(self, data, code=200):
         body = json.dumps(data).encode("utf-8")
         self.send_response(code)
@@ -338,10 +1191,99 @@ class CamcookieRequestHandler(BaseHTTPRequestHandler):
         # CORS preflight
         self.send_response(204)
         self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "GET, OPTIONS")
+        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
         self.send_header("Access-Control-Allow-Headers", "Content-Type")
         self.end_headers()
 
+    def do_POST(self):
+        parsed = urlparse(self.path)
+        qs = parse_qs(parsed.query)
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+        if length < 0:
+            # Can't tell where the body ends, so the connection can't be reused
+            self.close_connection = True
+            self._send_json({"ok": False, "error": "Invalid Content-Length"}, code=400)
+            return
+        raw = self.rfile.read(length) if length > 0 else b""
+
+        if parsed.path != "/batch":
+            self._send_json({"ok": False, "error": "Unknown endpoint"}, code=404)
+            return
+
+        try:
+            body = json.loads(raw.decode("utf-8")) if raw else {}
+            ops = body.get("ops", [])
+            if not isinstance(ops, list) or not all(isinstance(op, dict) for op in ops):
+                raise ValueError("ops must be a list of objects")
+        except Exception as e:
+            self._send_json({"ok": False, "error": f"Bad request: {e}"}, code=400)
+            return
+        if len(ops) > MAX_BATCH_OPS:
+            self._send_json({"ok": False, "error": f"Too many ops (max {MAX_BATCH_OPS})"}, code=400)
+            return
+
+        # One permission check covers the whole batch
+        app_id = body.get("app_id") or qs.get("app_id", [None])[0]
+        if app_id is None or not app_is_allowed(app_id):
+            self._send_json({"ok": False, "error": "Access denied or app not connected"}, code=403)
+            return
+
+        results = [run_plugin_op(op) for op in ops]
+        self._send_json({"ok": all(r["ok"] for r in results), "results": results})
+
+    def _stream_events(self):
+        """
+        Server-Sent Events: the full status first, then only the top-level
+        status keys whose value changed, sent as they change.
+
+        Only served by the pooled server, and to at most
+        server.max_subscribers clients; others get a 503 and poll /status.
+        """
+        subscribers = getattr(self.server, "subscribers", None)
+        if subscribers is None or not subscribers.acquire(blocking=False):
+            self._send_json({"ok": False, "error": "Live updates unavailable, poll /status"}, code=503)
+            # Don't let the refused client park on a worker via keep-alive
+            self.close_connection = True
+            return
+        try:
+            self._serve_events()
+        finally:
+            subscribers.release()
+
+    def _serve_events(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        self.connection.settimeout(None)
+
+        sent = {}
+        version = STATE.version
+        last_write = 0.0
+        try:
+            while not getattr(self.server, "closing", False):
+                status = get_status()
+                diff = {k: v for k, v in status.items() if sent.get(k) != v}
+                if diff:
+                    self.wfile.write(f"data: {json.dumps(diff)}\n\n".encode("utf-8"))
+                    sent = status
+                    last_write = time.monotonic()
+                elif time.monotonic() - last_write >= EVENTS_HEARTBEAT_SECONDS:
+                    # Comment line; lets us notice clients that went away
+                    self.wfile.write(b": ping\n\n")
+                    last_write = time.monotonic()
+                time.sleep(EVENTS_MIN_INTERVAL_SECONDS)
+                version = STATE.wait_for_change(version, EVENTS_CHECK_INTERVAL_SECONDS)
+        except (BrokenPipeError, ConnectionResetError, OSError):
+            return
+
     def _require_app(self, qs):
         app_id = qs.get("app_id", [None])[0]
         if not app_id:
@@ -356,13 +1298,11 @@ class CamcookieRequestHandler(BaseHTTPRequestHandler):
 
         # -------- Public status (UI) --------
         if path == "/status":
-            data = {
-                "plugins": plugin_manager.get_plugins_state(),
-                "arduino_data": STATE.arduino_data,
-                "connectable_apps": get_connectable_apps(),
-                "connected_apps": load_connected_apps()
-            }
-            self._send_json(data)
+            self._send_json(get_status())
+            return
+
+        if path == "/events":
+            self._stream_events()
             return
 
         # -------- Connect / Disconnect / Shutdown (by apps) --------
@@ -370,9 +1310,7 @@ class CamcookieRequestHandler(BaseHTTPRequestHandler):
             app_id = self._require_app(qs)
             if not app_id:
                 return
-            connected = load_connected_apps()
-            connected[app_id] = True
-            save_connected_apps(connected)
+            connected = CONNECTED_APPS.set(app_id, True)
             self._send_json({"ok": True, "connected": connected})
             return
 
@@ -380,10 +1318,9 @@ class CamcookieRequestHandler(BaseHTTPRequestHandler):
             app_id = self._require_app(qs)
             if not app_id:
                 return
+            if app_id in CONNECTED_APPS:
+                CONNECTED_APPS.set(app_id, False)
             connected = load_connected_apps()
-            if app_id in connected:
-                connected[app_id] = False
-            save_connected_apps(connected)
             if count_connected_apps() == 0:
                 schedule_shutdown_if_last()
             self._send_json({"ok": True, "connected": connected})
@@ -393,10 +1330,9 @@ class CamcookieRequestHandler(BaseHTTPRequestHandler):
             app_id = self._require_app(qs)
             if not app_id:
                 return
+            if app_id in CONNECTED_APPS:
+                CONNECTED_APPS.set(app_id, False)
             connected = load_connected_apps()
-            if app_id in connected:
-                connected[app_id] = False
-            save_connected_apps(connected)
             if count_connected_apps() == 0:
                 schedule_shutdown_if_last()
                 self._send_json({"ok": True, "shutting_down": True})
@@ -418,13 +1354,7 @@ class CamcookieRequestHandler(BaseHTTPRequestHandler):
                 plugin_manager.enable_plugin(pid)
             else:
                 plugin_manager.disable_plugin(pid)
-            data = {
-                "plugins": plugin_manager.get_plugins_state(),
-                "arduino_data": STATE.arduino_data,
-                "connectable_apps": get_connectable_apps(),
-                "connected_apps": load_connected_apps()
-            }
-            self._send_json({"ok": True, "state": data})
+            self._send_json({"ok": True, "state": get_status()})
             return
 
         # -------- Protected endpoints (need app_id + permission) --------
@@ -472,16 +1402,336 @@ class CamcookieRequestHandler(BaseHTTPRequestHandler):
             self._send_json({"ok": True, "temp": value})
             return
 
+        if path == "/temp/history":
+            temp = plugin_manager.get_plugin("temp")
+            if not temp:
+                self._send_json({"ok": False, "error": "Temp plugin not found"}, code=404)
+                return
+            try:
+                seconds = float(qs.get("seconds", ["3600"])[0])
+                points = int(qs.get("points", ["60"])[0])
+            except ValueError:
+                self._send_json({"ok": False, "error": "Invalid seconds/points"}, code=400)
+                return
+            if not math.isfinite(seconds) or seconds <= 0 or not 1 <= points <= TEMP_HISTORY_SIZE:
+                self._send_json({"ok": False, "error": "Invalid seconds/points"}, code=400)
+                return
+            self._send_json({
+                "ok": True,
+                "interval": temp.interval,
+                "points": temp.history.windows(seconds, points)
+            })
+            return
+
         self._send_json({"ok": False, "error": "Unknown endpoint"}, code=404)
 
 
-def start_http_server():
-    server = HTTPServer((HTTP_HOST, HTTP_PORT), CamcookieRequestHandler)
+class PooledHTTPServer(HTTPServer):
+    """HTTPServer that handles each connection on a bounded thread pool."""
+
+    keep_alive = True
+
+    def __init__(self, server_address, handler_class, workers):
+        super().__init__(server_address, handler_class)
+        # Tells long-lived handlers (/events) to return so the pool can exit
+        self.closing = False
+        # Leaves at least one worker for ordinary requests
+        self.max_subscribers = max(0, min(EVENTS_MAX_SUBSCRIBERS, workers - 1))
+        self.subscribers = threading.BoundedSemaphore(self.max_subscribers) \
+            if self.max_subscribers else None
+        self.pool = ThreadPoolExecutor(max_workers=workers,
+                                       thread_name_prefix="camcookie-http")
+
+    def process_request(self, request, client_address):
+        self.pool.submit(self._process_request_worker, request, client_address)
+
+    def _process_request_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        self.closing = True
+        super().server_close()
+        self.pool.shutdown(wait=False)
+
+
+def start_http_server(host=HTTP_HOST, port=HTTP_PORT, workers=HTTP_WORKERS):
+    if workers > 1:
+        server = PooledHTTPServer((host, port), CamcookieRequestHandler, workers)
+    else:
+        server = HTTPServer((host, port), CamcookieRequestHandler)
     thread = threading.Thread(target=server.serve_forever, daemon=True)
     thread.start()
     return server
 
 
+# ============================================================
+#  Streaming input channel
+# ============================================================
+# After a "HELLO <app_id>\n" line the client sends fixed 3-byte frames:
+#   0x01 dx dy   move (dx/dy signed bytes, clamped to +-50)
+#   0x02 0  0    click
+#   0x03 0  0    ping; answered with one 0x03 byte once earlier frames ran
+STREAM_FRAME = struct.Struct("<Bbb")
+FRAME_MOVE = 0x01
+FRAME_CLICK = 0x02
+FRAME_PING = 0x03
+
+
+class StreamInputHandler(socketserver.StreamRequestHandler):
+    disable_nagle_algorithm = True
+
+    def handle(self):
+        hello = self.rfile.readline(256).decode("utf-8", errors="ignore").split()
+        if len(hello) != 2 or hello[0] != "HELLO" or not app_is_allowed(hello[1]):
+            self.wfile.write(b"DENIED\n")
+            return
+        app_id = hello[1]
+        self.wfile.write(b"OK\n")
+
+        size = STREAM_FRAME.size
+        pending = b""
+        while True:
+            # Through rfile, so frames that arrived along with HELLO and
+            # are already buffered there come first
+            chunk = self.rfile.read1(4096)
+            if not chunk:
+                return
+            # Permission is re-checked per read so /disconnect ends the stream
+            if not app_is_allowed(app_id):
+                return
+            data = pending + chunk
+            usable = len(data) - len(data) % size
+            pending = data[usable:]
+
+            # Moves in one read are summed into a single emit
+            dx = dy = 0
+            for kind, fx, fy in STREAM_FRAME.iter_unpack(data[:usable]):
+                if kind == FRAME_MOVE:
+                    dx += max(min(fx, 50), -50)
+                    dy += max(min(fy, 50), -50)
+                    continue
+                if dx or dy:
+                    MOUSE.move(dx, dy)
+                    dx = dy = 0
+                if kind == FRAME_CLICK:
+                    MOUSE.click()
+                elif kind == FRAME_PING:
+                    self.wfile.write(bytes([FRAME_PING]))
+            if dx or dy:
+                MOUSE.move(dx, dy)
+
+
+class StreamInputServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def start_stream_server(host=HTTP_HOST, port=STREAM_PORT):
+    server = StreamInputServer((host, port), StreamInputHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+# ============================================================
+#  Benchmark
+# ============================================================
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def benchmark_http(app_id, seconds=5, pollers=4):
+    """
+    Measure /mouse/move latency while other clients poll /status, once on
+    the single-threaded server and once on the pooled one. app_id must be
+    installed and connected; moves use dx=dy=0 so the cursor stays put.
+    """
+    import http.client
+
+    def poll_status(port, stop):
+        conn = http.client.HTTPConnection(HTTP_HOST, port, timeout=10)
+        while not stop.is_set():
+            conn.request("GET", "/status")
+            conn.getresponse().read()
+            conn.close()
+
+    for workers in (1, HTTP_WORKERS):
+        server = start_http_server(port=0, workers=workers)
+        port = server.server_address[1]
+        stop = threading.Event()
+        threads = [threading.Thread(target=poll_status, args=(port, stop), daemon=True)
+                   for _ in range(pollers)]
+        for t in threads:
+            t.start()
+
+        samples = []
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            conn = http.client.HTTPConnection(HTTP_HOST, port, timeout=10)
+            t0 = time.perf_counter()
+            conn.request("GET", f"/mouse/move?dx=0&dy=0&app_id={app_id}")
+            conn.getresponse().read()
+            samples.append((time.perf_counter() - t0) * 1000)
+            conn.close()
+
+        stop.set()
+        for t in threads:
+            t.join()
+        server.shutdown()
+        server.server_close()
+
+        print(f"workers={workers:<3} requests={len(samples):<6} "
+              f"p50={_percentile(samples, 50):.2f} ms  p99={_percentile(samples, 99):.2f} ms")
+
+
+def benchmark_serial(frames=20000, devices=3):
+    """
+    Push frames of both Arduino protocols through pseudo-terminals read by
+    one DeviceReactor and report parse cost, total pty throughput and the
+    ceiling each protocol has on a real serial link (10 bits per byte).
+    """
+    import tty
+
+    def encode_text(i):
+        return f"MOVE {i % 41 - 20} {20 - i % 41}\n".encode("ascii")
+
+    def encode_binary(i):
+        dx = (i % 41 - 20) & 0xFF
+        dy = (20 - i % 41) & 0xFF
+        seq = i & 0xFF
+        return bytes([BinaryFrameParser.SYNC, 1, seq, dx, dy, 1 ^ seq ^ dx ^ dy])
+
+    for parser_class, encode, baud in ((AsciiFrameParser, encode_text, ARDUINO_LEGACY_BAUD),
+                                       (BinaryFrameParser, encode_binary, ARDUINO_BAUD)):
+        payload = b"".join(encode(i) for i in range(frames))
+
+        parser = parser_class()
+        t0 = time.perf_counter()
+        for offset in range(0, len(payload), 64):
+            parser.feed(payload[offset:offset + 64])
+        parse_us = (time.perf_counter() - t0) / frames * 1e6
+
+        # Several pseudo-terminal "devices" multiplexed on one reactor
+        reactor = DeviceReactor()
+        ptys = []
+        counts = []
+        finished = threading.Event()
+        for index in range(devices):
+            master, slave = os.openpty()
+            tty.setraw(slave)
+            slave_file = os.fdopen(slave, "rb", buffering=0)
+            ptys.append((master, slave_file))
+            counts.append(0)
+
+            def on_data(data, index=index, parser=parser_class()):
+                counts[index] += len(parser.feed(data))
+                if sum(counts) >= frames * devices:
+                    finished.set()
+            reactor.add(slave_file, on_data, lambda: None)
+
+        writers = [threading.Thread(target=os.write, args=(master, payload), daemon=True)
+                   for master, _ in ptys]
+        t0 = time.perf_counter()
+        for w in writers:
+            w.start()
+        finished.wait(timeout=60)
+        elapsed = time.perf_counter() - t0
+        for (master, slave_file), w in zip(ptys, writers):
+            w.join()
+            reactor.remove(slave_file)
+            slave_file.close()
+            os.close(master)
+
+        frame_bytes = len(payload) / frames
+        print(f"{parser_class.name:<7} {frame_bytes:4.1f} B/frame  parse={parse_us:.2f} us/frame  "
+              f"pty x{devices}={sum(counts) / elapsed:,.0f} frames/s  "
+              f"wire ceiling @ {baud} baud={baud / 10 / frame_bytes:,.0f} frames/s")
+
+
+def benchmark_stream(app_id, seconds=5, burst=32):
+    """
+    Compare mouse events/sec and round-trip latency of /mouse/move over a
+    keep-alive HTTP connection with the streaming channel. Each stream
+    sample is a burst of move frames followed by a ping.
+    """
+    import http.client
+    import socket
+
+    http_server = start_http_server(port=0)
+    conn = http.client.HTTPConnection(HTTP_HOST, http_server.server_address[1], timeout=10)
+    samples = []
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        t0 = time.perf_counter()
+        conn.request("GET", f"/mouse/move?dx=0&dy=0&app_id={app_id}")
+        conn.getresponse().read()
+        samples.append((time.perf_counter() - t0) * 1000)
+    conn.close()
+    http_server.shutdown()
+    http_server.server_close()
+    print(f"http    events/s={len(samples) / seconds:<9.0f} "
+          f"p50={_percentile(samples, 50):.3f} ms  p99={_percentile(samples, 99):.3f} ms")
+
+    stream_server = start_stream_server(port=0)
+    sock = socket.create_connection((HTTP_HOST, stream_server.server_address[1]), timeout=10)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.sendall(f"HELLO {app_id}\n".encode("utf-8"))
+    if sock.makefile("rb").readline().strip() != b"OK":
+        print("stream  denied: is the app installed and connected?")
+        sock.close()
+        stream_server.shutdown()
+        stream_server.server_close()
+        return
+    payload = STREAM_FRAME.pack(FRAME_MOVE, 0, 0) * burst + STREAM_FRAME.pack(FRAME_PING, 0, 0)
+    samples = []
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        t0 = time.perf_counter()
+        sock.sendall(payload)
+        sock.recv(1)
+        samples.append((time.perf_counter() - t0) * 1000)
+    sock.close()
+    stream_server.shutdown()
+    stream_server.server_close()
+    print(f"stream  events/s={len(samples) * burst / seconds:<9.0f} "
+          f"p50={_percentile(samples, 50):.3f} ms  p99={_percentile(samples, 99):.3f} ms "
+          f"(per {burst}-event burst)")
+
+
+def benchmark_temp(delay=0.25, interval=0.1, seconds=3.0):
+    """
+    Compare a direct read of a slow simulated sensor with the cached
+    read_temp(), then sample for a few seconds and print the history.
+    """
+    sensor = SimulatedTempSensor(delay=delay, period=seconds, seed=1)
+    temp = TempPlugin(None, sensor=sensor, interval=interval, history_size=1000)
+
+    t0 = time.perf_counter()
+    sensor.read()
+    print(f"direct sensor read: {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+    sensor.delay = delay / 10
+    temp.start()
+    time.sleep(interval)
+    t0 = time.perf_counter()
+    for _ in range(10000):
+        temp.read_temp()
+    print(f"cached read_temp(): {(time.perf_counter() - t0) / 10000 * 1e6:.2f} us")
+
+    time.sleep(seconds)
+    temp.stop()
+    print(f"{temp.history.count} samples in {seconds:.0f} s at {interval * 1000:.0f} ms cadence")
+    for w in temp.history.windows(seconds, 6):
+        print(f"  {w['count']:>3} samples  min {w['min']:6.2f}  max {w['max']:6.2f}  avg {w['avg']:6.2f}")
+
+
 # ============================================================
 #  Main
 # ============================================================
@@ -498,7 +1748,26 @@ def main():
     plugin_manager.register(led_plugin)
     plugin_manager.register(temp_plugin)
 
+    if len(sys.argv) >= 3 and sys.argv[1] == "--benchmark":
+        # python3 app.py --benchmark <connected app_id>
+        CATALOG.refresh()
+        benchmark_http(sys.argv[2])
+        return
+    if len(sys.argv) >= 2 and sys.argv[1] == "--benchmark-serial":
+        benchmark_serial()
+        return
+    if len(sys.argv) >= 2 and sys.argv[1] == "--benchmark-temp":
+        benchmark_temp()
+        return
+    if len(sys.argv) >= 3 and sys.argv[1] == "--benchmark-stream":
+        CATALOG.refresh()
+        benchmark_stream(sys.argv[2])
+        return
+
+    CATALOG.refresh_async()
+    watch_state_files()
     http_server = start_http_server()
+    stream_server = start_stream_server()
 
     # Backend just runs; UI is Chromium pointing to web/index.html
     try:
@@ -508,6 +1777,9 @@ def main():
         pass
 
     http_server.shutdown()
+    http_server.server_close()
+    stream_server.shutdown()
+    flush_state()
     for p in plugin_manager.plugins.values():
         p.stop()
 
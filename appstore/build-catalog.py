@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# Builds the versioned catalog from appstore.json:
+#
+#   catalog/index.json       catalog revision + one small entry per app
+#                            (listing fields and the app's "rev")
+#   catalog/apps/<id>.json   full app document, including install scripts
+#
+# An app's rev goes up only when its document changes, so clients fetch
+# the index and then just the apps whose rev differs from their copy.
+# Run this after every edit to appstore.json and commit the output.
+import json
+import os
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_FILE = os.path.join(BASE_DIR, "appstore.json")
+CATALOG_DIR = os.path.join(BASE_DIR, "catalog")
+INDEX_FILE = os.path.join(CATALOG_DIR, "index.json")
+APPS_DIR = os.path.join(CATALOG_DIR, "apps")
+
+# Fields copied into the index: enough to list, search and filter apps
+INDEX_FIELDS = ["id", "name", "creator", "description", "icon", "version", "tags", "plugin"]
+
+
+def load_json(path, default):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except Exception:
+        return default
+
+
+def write_json(path, data):
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def main():
+    apps = load_json(SOURCE_FILE, None)["apps"]
+    old_index = load_json(INDEX_FILE, {"revision": 0, "apps": []})
+    old_revs = {entry["id"]: entry["rev"] for entry in old_index["apps"]}
+    os.makedirs(APPS_DIR, exist_ok=True)
+
+    changed = []
+    entries = []
+    for app in apps:
+        app_id = app["id"]
+        path = os.path.join(APPS_DIR, f"{app_id}.json")
+        old_doc = load_json(path, {})
+        rev = old_revs.get(app_id, 0)
+        if {k: v for k, v in old_doc.items() if k != "rev"} != app or app_id not in old_revs:
+            rev += 1
+            changed.append(app_id)
+            write_json(path, dict(app, rev=rev))
+        entry = {field: app[field] for field in INDEX_FIELDS if field in app}
+        entry["rev"] = rev
+        entries.append(entry)
+
+    removed = [app_id for app_id in old_revs if app_id not in {a["id"] for a in apps}]
+    for app_id in removed:
+        try:
+            os.remove(os.path.join(APPS_DIR, f"{app_id}.json"))
+        except OSError:
+            pass
+
+    revision = old_index["revision"]
+    if changed or removed or [e["id"] for e in entries] != [e["id"] for e in old_index["apps"]]:
+        revision += 1
+    write_json(INDEX_FILE, {"revision": revision, "apps": entries})
+
+    print(f"catalog revision {revision}: {len(changed)} changed, {len(removed)} removed")
+    for app_id in changed:
+        print(f"  {app_id}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,75 @@
 #!/usr/bin/env python3
 import tkinter as tk
-from tkinter import ttk, messagebox, colorchooser
+from tkinter import ttk, messagebox
 import subprocess
+import signal
 import json
+import hashlib
+import shutil
+import time
 import urllib.request
+import urllib.error
 import os
 import sys
-import webbrowser
+import threading
+import bisect
+import queue
+from concurrent.futures import ThreadPoolExecutor
 import re
 
 # =========================
 # Basic config and paths
 # =========================
 
-APPSTORE_URL = "https://camcookie876.github.io/PI/appstore/appstore.json"
+# Where the catalog is published; CAMCOOKIE_CATALOG_BASE points the store
+# at a mirror or a local stand-in (see benchmark_startup)
+CATALOG_BASE_URL = os.environ.get("CAMCOOKIE_CATALOG_BASE",
+                                  "https://camcookie876.github.io/PI/appstore/")
+APPSTORE_URL = CATALOG_BASE_URL + "appstore.json"
+# Versioned catalog written by build-catalog.py
+CATALOG_INDEX_URL = CATALOG_BASE_URL + "catalog/index.json"
+CATALOG_APP_URL = CATALOG_BASE_URL + "catalog/apps/{}.json"
 
 HOME = os.path.expanduser("~")
 LOCAL_DB = os.path.join(HOME, ".camcookie_installed.json")
 ICON_CACHE_DIR = os.path.join(HOME, ".camcookie", "icons")
 SETTINGS_FILE = os.path.join(HOME, ".camcookie", "appstore-settings.json")
+CATALOG_CACHE_FILE = os.path.join(HOME, ".camcookie", "catalog.json")
+CATALOG_META_FILE = os.path.join(HOME, ".camcookie", "catalog-meta.json")
+CATALOG_TIMEOUT_SECONDS = 15
+ICON_META_FILE = os.path.join(ICON_CACHE_DIR, "icons-meta.json")
+ICON_FETCH_WORKERS = 4
+ICON_TIMEOUT_SECONDS = 10
+# Pre-scaled icons, named <source sha256>-<size>.png
+ICON_VARIANT_DIR = os.path.join(ICON_CACHE_DIR, "variants")
+# Icon sizes the UI draws; each gets a pre-scaled variant
+ICON_VARIANT_SIZES = (56,)
+# Limit for the helper process that renders one icon's variants
+ICON_RENDER_TIMEOUT_SECONDS = 30
+SEARCH_DEBOUNCE_MS = 150
+# Jobs run at the same time; apt/dpkg steps still run one at a time, and
+# the leading apt lines of installs waiting together run as one transaction
+JOB_WORKERS = 2
+ARTIFACT_CACHE_DIR = os.path.join(HOME, ".camcookie", "artifacts")
+ARTIFACT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+ARTIFACT_TIMEOUT_SECONDS = 30
 
 os.makedirs(ICON_CACHE_DIR, exist_ok=True)
+os.makedirs(ICON_VARIANT_DIR, exist_ok=True)
 os.makedirs(os.path.dirname(SETTINGS_FILE), exist_ok=True)
 
 icon_cache_images = {}
 
+# Icon prefetch state: futures per app id for this session, canvases waiting
+# for an icon, and finished downloads waiting to be handled on the Tk thread
+icon_pool = ThreadPoolExecutor(max_workers=ICON_FETCH_WORKERS)
+icon_fetches = {}
+icon_widgets = {}
+icon_ready = queue.Queue()
+icon_meta_lock = threading.Lock()
+# app id -> {size: variant path}, filled in on icon_pool
+icon_variants = {}
+
 # =========================
 # Settings
 # =========================
@@ -92,10 +137,425 @@ def expand_home(text):
 def expand_list(cmds):
     return [expand_home(c) for c in cmds]
 
+def write_file_atomic(path, text):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+def load_catalog_snapshot():
+    """Last good catalog saved on disk, or None if there isn't one."""
+    try:
+        with open(CATALOG_CACHE_FILE, "r") as f:
+            return json.load(f)["apps"]
+    except Exception:
+        return None
+
+def fetch_json(url, headers=None):
+    """GET url and return (data, response headers)."""
+    request = urllib.request.Request(url, headers=headers or {})
+    with urllib.request.urlopen(request, timeout=CATALOG_TIMEOUT_SECONDS) as response:
+        return json.loads(response.read().decode()), response.headers
+
 def load_catalog():
-    with urllib.request.urlopen(APPSTORE_URL) as response:
-        data = response.read().decode()
-        return json.loads(data)["apps"]
+    """
+    Update the catalog from the versioned index: revalidate index.json
+    with ETag / Last-Modified, then download only the apps whose rev
+    differs from the snapshot. Returns the app list, or None if the
+    snapshot is still current. Falls back to the single appstore.json
+    when the index isn't published.
+    """
+    headers = {}
+    if os.path.exists(CATALOG_CACHE_FILE):
+        try:
+            with open(CATALOG_META_FILE, "r") as f:
+                meta = json.load(f)
+        except Exception:
+            meta = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        index, response_headers = fetch_json(CATALOG_INDEX_URL, headers)
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return None
+        if e.code != 404:
+            raise
+        index, response_headers = fetch_json(APPSTORE_URL)
+    meta = {
+        "etag": response_headers.get("ETag"),
+        "last_modified": response_headers.get("Last-Modified")
+    }
+
+    cached = {app.get("id"): app for app in load_catalog_snapshot() or []}
+    stale = [entry["id"] for entry in index["apps"]
+             if "rev" in entry and cached.get(entry["id"], {}).get("rev") != entry["rev"]]
+    if stale:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            docs = pool.map(lambda app_id: fetch_json(CATALOG_APP_URL.format(app_id))[0], stale)
+            cached.update(zip(stale, docs))
+
+    # Entries without a rev come from the full appstore.json
+    apps = [cached[entry["id"]] if "rev" in entry else entry for entry in index["apps"]]
+    write_file_atomic(CATALOG_CACHE_FILE, json.dumps({"revision": index.get("revision"), "apps": apps}))
+    write_file_atomic(CATALOG_META_FILE, json.dumps(meta))
+    return apps
+
+def start_catalog_refresh(on_done):
+    """
+    Run load_catalog() on a background thread and call on_done(apps, error)
+    on the Tk thread when it finishes.
+    """
+    result = {}
+
+    def worker():
+        try:
+            result["apps"] = load_catalog()
+        except Exception as e:
+            result["error"] = e
+        result["done"] = True
+
+    def poll():
+        if not result.get("done"):
+            root.after(100, poll)
+            return
+        on_done(result.get("apps"), result.get("error"))
+
+    threading.Thread(target=worker, daemon=True).start()
+    root.after(100, poll)
+
+# =========================
+# Install download cache (no Tk needed)
+# =========================
+
+# "wget URL -O PATH" / "wget -O PATH URL" steps, served from ArtifactCache
+WGET_STEP_REGEX = re.compile(
+    r"^\s*wget\s+(?:-q\s+)?(?:(?P<url>https?://\S+)\s+-O\s+(?P<path>\S+)"
+    r"|-O\s+(?P<path2>\S+)\s+(?P<url2>https?://\S+))\s*$"
+)
+
+class ArtifactCache:
+    """
+    Files downloaded by install steps, stored under their SHA-256.
+
+    An app can list "hashes": {url: sha256} in the catalog. A URL whose
+    hash is already stored is copied from disk without any request; other
+    URLs are revalidated with ETag / Last-Modified. The least recently
+    used files are dropped once the cache grows past max_bytes.
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(directory, "index.json")
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        try:
+            with open(self.index_path, "r") as f:
+                index = json.load(f)
+        except Exception:
+            index = {}
+        self.urls = index.get("urls", {})        # url -> sha256, etag, last_modified
+        self.objects = index.get("objects", {})  # sha256 -> size, used
+
+    def object_path(self, digest):
+        return os.path.join(self.directory, digest)
+
+    def has(self, digest):
+        return digest in self.objects and os.path.exists(self.object_path(digest))
+
+    def fetch(self, url, dest, digest=None):
+        """
+        Put the content of url at dest. Returns "cached", "revalidated" or
+        "downloaded". Raises ValueError if the download doesn't match digest.
+        """
+        with self.lock:
+            known = dict(self.urls.get(url, {}))
+            source = "cached" if digest and self.has(digest) else None
+
+        if source is None:
+            headers = {}
+            if not digest and self.has(known.get("sha256")):
+                if known.get("etag"):
+                    headers["If-None-Match"] = known["etag"]
+                if known.get("last_modified"):
+                    headers["If-Modified-Since"] = known["last_modified"]
+
+            request = urllib.request.Request(url, headers=headers)
+            try:
+                with urllib.request.urlopen(request, timeout=ARTIFACT_TIMEOUT_SECONDS) as response:
+                    data = response.read()
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+            except urllib.error.HTTPError as e:
+                if e.code != 304:
+                    raise
+                digest = known["sha256"]
+                source = "revalidated"
+
+        if source is None:
+            actual = hashlib.sha256(data).hexdigest()
+            if digest and actual != digest:
+                raise ValueError(f"{url} does not match its catalog hash")
+            digest = actual
+            tmp_path = f"{self.object_path(digest)}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.object_path(digest))
+            with self.lock:
+                self.urls[url] = {"sha256": digest, "etag": etag, "last_modified": last_modified}
+                self.objects[digest] = {"size": len(data)}
+            source = "downloaded"
+
+        with self.lock:
+            self.objects[digest]["used"] = time.time()
+            os.makedirs(os.path.dirname(dest) or ".", exist_ok=True)
+            shutil.copyfile(self.object_path(digest), dest)
+            self._evict(keep=digest)
+            write_file_atomic(self.index_path, json.dumps({"urls": self.urls, "objects": self.objects}))
+        return source
+
+    def _evict(self, keep):
+        total = sum(obj["size"] for obj in self.objects.values())
+        for digest in sorted(self.objects, key=lambda d: self.objects[d].get("used", 0)):
+            if total <= self.max_bytes:
+                break
+            if digest == keep:
+                continue
+            total -= self.objects.pop(digest)["size"]
+            try:
+                os.remove(self.object_path(digest))
+            except OSError:
+                pass
+        self.urls = {url: entry for url, entry in self.urls.items()
+                     if entry.get("sha256") in self.objects}
+
+artifact_cache = ArtifactCache(ARTIFACT_CACHE_DIR, ARTIFACT_CACHE_MAX_BYTES)
+
+def benchmark_artifacts(files=20, size=256 * 1024):
+    """Install-style downloads from a local HTTP stand-in: cold, revalidated, hashed."""
+    import tempfile
+    from functools import partial
+    from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+    requests_seen = []
+
+    class Handler(SimpleHTTPRequestHandler):
+        def log_message(self, *args):
+            requests_seen.append(self.path)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        site = os.path.join(tmp, "site")
+        os.makedirs(site)
+        hashes = {}
+        server = ThreadingHTTPServer(("127.0.0.1", 0), partial(Handler, directory=site))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        for i in range(files):
+            data = os.urandom(size)
+            with open(os.path.join(site, f"file{i}"), "wb") as f:
+                f.write(data)
+            hashes[f"{base}/file{i}"] = hashlib.sha256(data).hexdigest()
+
+        cache = ArtifactCache(os.path.join(tmp, "cache"), files * size)
+        for label, use_hashes in (("cold", False), ("revalidated", False), ("hashed", True)):
+            requests_seen.clear()
+            sources = set()
+            t0 = time.perf_counter()
+            for url, digest in hashes.items():
+                sources.add(cache.fetch(url, os.path.join(tmp, "out", url.rsplit("/", 1)[1]),
+                                        digest if use_hashes else None))
+            elapsed = (time.perf_counter() - t0) * 1000
+            print(f"{label:<12} {files} files  {len(requests_seen):>3} requests  "
+                  f"{elapsed:6.1f} ms  ({', '.join(sorted(sources))})")
+
+        cache.max_bytes = files * size // 2
+        cache.fetch(f"{base}/file0", os.path.join(tmp, "out", "file0"), hashes[f"{base}/file0"])
+        print(f"after shrinking to half: {len(cache.objects)} files kept")
+        server.shutdown()
+
+# =========================
+# Search index (no Tk needed)
+# =========================
+
+# Relevance of a query token found in each field
+SEARCH_FIELD_WEIGHTS = {
+    "name": 8,
+    "id": 6,
+    "tags": 4,
+    "creator": 2,
+    "description": 1
+}
+SEARCH_TOKEN_REGEX = re.compile(r"[a-z0-9]+")
+
+def search_tokens(text):
+    return SEARCH_TOKEN_REGEX.findall(str(text).lower())
+
+class SearchIndex:
+    """
+    Inverted index over a catalog, built once per catalog load.
+
+    Every query token must prefix-match a token of the app; apps are
+    ranked by the best field each query token hit (name > tags >
+    description), with whole-word hits counting double.
+    """
+
+    def __init__(self, apps):
+        self.apps = list(apps)
+        self.postings = {}
+        for pos, app in enumerate(self.apps):
+            for field, weight in SEARCH_FIELD_WEIGHTS.items():
+                value = app.get(field, "")
+                if field == "tags":
+                    value = " ".join(value or [])
+                for token in search_tokens(value):
+                    entry = self.postings.setdefault(token, {})
+                    if entry.get(pos, 0) < weight:
+                        entry[pos] = weight
+        self.tokens = sorted(self.postings)
+
+    def _prefixed(self, prefix):
+        start = bisect.bisect_left(self.tokens, prefix)
+        for token in self.tokens[start:]:
+            if not token.startswith(prefix):
+                break
+            yield token
+
+    def search(self, query):
+        terms = search_tokens(query)
+        if not terms:
+            return list(self.apps)
+
+        scores = None
+        for term in terms:
+            term_scores = {}
+            for token in self._prefixed(term):
+                bonus = 2 if token == term else 1
+                for pos, weight in self.postings[token].items():
+                    score = weight * bonus
+                    if term_scores.get(pos, 0) < score:
+                        term_scores[pos] = score
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {pos: scores[pos] + score
+                          for pos, score in term_scores.items() if pos in scores}
+            if not scores:
+                return []
+
+        ranked = sorted(scores, key=lambda pos: (-scores[pos], pos))
+        return [self.apps[pos] for pos in ranked]
+
+def benchmark_search(count=10000, queries=("cam", "python editor", "led mouse", "zzz")):
+    import random
+    import time
+
+    words = ["camcookie", "python", "maker", "editor", "plugin", "mouse", "led",
+             "theme", "store", "game", "music", "video", "paint", "notes", "clock"]
+    rng = random.Random(1)
+    apps = [{
+        "id": f"app{i}",
+        "name": " ".join(rng.sample(words, 2)),
+        "creator": f"Creator {i % 50}",
+        "description": " ".join(rng.choice(words) for _ in range(30)),
+        "tags": rng.sample(words, 3)
+    } for i in range(count)]
+
+    t0 = time.perf_counter()
+    index = SearchIndex(apps)
+    print(f"index {count} apps: {(time.perf_counter() - t0) * 1000:.1f} ms")
+    for query in queries:
+        t0 = time.perf_counter()
+        for _ in range(20):
+            results = index.search(query)
+        elapsed = (time.perf_counter() - t0) / 20 * 1000
+        print(f"search {query!r:<16} {len(results):>6} results  {elapsed:.2f} ms")
+
+# =========================
+# Icon variants
+# =========================
+
+def icon_variant_paths(source_path, sizes=ICON_VARIANT_SIZES):
+    """
+    {size: path} of the pre-scaled PNGs for an icon, keyed by the source
+    file's hash (no Tk needed, so it runs on icon_pool).
+    """
+    with open(source_path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    return {size: os.path.join(ICON_VARIANT_DIR, f"{digest}-{size}.png") for size in sizes}
+
+def render_icon_variants(source_path, variants):
+    """
+    Write the variants missing on disk (runs on icon_pool). PhotoImage
+    can only be used on the Tk thread, so the decode and scale run in a
+    helper process with its own Tk (--render-icon-variants). The source
+    is only decoded when a variant is missing. Returns True if any file
+    was written.
+    """
+    missing = {size: path for size, path in variants.items() if not os.path.exists(path)}
+    if not missing:
+        return False
+    subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--render-icon-variants", source_path]
+        + [f"{size}={path}" for size, path in missing.items()],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        timeout=ICON_RENDER_TIMEOUT_SECONDS, check=True
+    )
+    return True
+
+def write_icon_variants(source_path, variants):
+    """Decode, subsample and encode with PhotoImage (needs a Tk in this process)."""
+    source = tk.PhotoImage(file=source_path)
+    longest = max(source.width(), source.height())
+    for size, path in variants.items():
+        # Smallest integer factor that fits inside size x size
+        factor = max(1, -(-longest // size))
+        img = source.subsample(factor, factor) if factor > 1 else source
+        tmp_path = f"{path}.tmp"
+        img.write(tmp_path, format="png")
+        os.replace(tmp_path, path)
+
+def icon_render_helper(args):
+    """Entry point of the --render-icon-variants helper: <source> <size>=<path>..."""
+    tk_root = tk.Tk()
+    tk_root.withdraw()
+    try:
+        variants = {}
+        for arg in args[1:]:
+            size, path = arg.split("=", 1)
+            variants[int(size)] = path
+        write_icon_variants(args[0], variants)
+    finally:
+        tk_root.destroy()
+
+def benchmark_icons(runs=3):
+    """
+    Variant rendering for the repo's own icons: cold, then warm (already
+    on disk), and how long drain_icon_queue() holds the Tk thread per icon.
+    """
+    import tempfile
+
+    icons_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app", "icons")
+    sources = sorted(os.path.join(icons_dir, name) for name in os.listdir(icons_dir))
+    global ICON_VARIANT_DIR
+    saved_dir = ICON_VARIANT_DIR
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            ICON_VARIANT_DIR = tmp
+            for label in ["cold"] + ["warm"] * runs:
+                t0 = time.perf_counter()
+                rendered = 0
+                for source in sources:
+                    rendered += render_icon_variants(source, icon_variant_paths(source))
+                elapsed = (time.perf_counter() - t0) * 1000
+                print(f"{label:<5} {len(sources)} icons -> {list(ICON_VARIANT_SIZES)}  "
+                      f"{rendered} rendered  {elapsed:8.1f} ms on icon_pool "
+                      f"({elapsed / len(sources):.1f} ms per icon)")
+    finally:
+        ICON_VARIANT_DIR = saved_dir
 
 # =========================
 # Icon handling (V1.5: resize + rounded background)
@@ -112,31 +572,145 @@ def get_icon_path_for_app(app):
     local_icon_path = os.path.join(ICON_CACHE_DIR, f"{app_id}{ext}")
     return icon_url, local_icon_path
 
-def download_icon_if_needed(app):
-    result = get_icon_path_for_app(app)
-    if not result:
-        return None
-    icon_url, local_icon_path = result
+def load_icon_meta():
+    try:
+        with open(ICON_META_FILE, "r") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+icon_meta = load_icon_meta()
+
+def fetch_icon(app):
+    """
+    Download or revalidate one icon (runs on icon_pool). Returns True if
+    the file on disk changed.
+    """
+    icon_url, local_icon_path = get_icon_path_for_app(app)
+    app_id = app.get("id", "unknown")
+
+    headers = {}
+    with icon_meta_lock:
+        meta = icon_meta.get(app_id, {})
+    if os.path.exists(local_icon_path) and meta.get("url") == icon_url:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    request = urllib.request.Request(icon_url, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=ICON_TIMEOUT_SECONDS) as response:
+            data = response.read()
+            new_meta = {
+                "url": icon_url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified")
+            }
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return False
+        raise
+
+    tmp_path = f"{local_icon_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, local_icon_path)
+    with icon_meta_lock:
+        icon_meta[app_id] = new_meta
+        write_file_atomic(ICON_META_FILE, json.dumps(icon_meta))
+    return True
+
+def prepare_icon(app):
+    """
+    Fetch or revalidate an icon and render its missing size variants (runs
+    on icon_pool). Returns True if the displayed image changed.
+    """
+    try:
+        changed = fetch_icon(app)
+    except Exception:
+        # Offline: keep using the copy on disk
+        changed = False
+    local_icon_path = get_icon_path_for_app(app)[1]
     if not os.path.exists(local_icon_path):
+        return changed
+    variants = icon_variant_paths(local_icon_path)
+    try:
+        changed = render_icon_variants(local_icon_path, variants) or changed
+    except Exception:
+        # No display, or not an image PhotoImage reads; load_icon_image()
+        # falls back to the source
+        pass
+    app_id = app.get("id", "unknown")
+    with icon_meta_lock:
+        new = icon_variants.get(app_id) != variants
+        icon_variants[app_id] = variants
+    return changed or new
+
+def prefetch_icons(apps):
+    """Queue a download/revalidation for every icon not yet checked this session."""
+    started = False
+    for app in apps:
+        app_id = app.get("id", "unknown")
+        if app_id in icon_fetches or not get_icon_path_for_app(app):
+            continue
+        future = icon_pool.submit(prepare_icon, app)
+        future.add_done_callback(lambda f, a=app: icon_ready.put((a, f)))
+        icon_fetches[app_id] = future
+        started = True
+    if started:
+        root.after(100, drain_icon_queue)
+
+def drain_icon_queue():
+    while True:
         try:
-            urllib.request.urlretrieve(icon_url, local_icon_path)
+            app, future = icon_ready.get_nowait()
+        except queue.Empty:
+            break
+        app_id = app.get("id", "unknown")
+        try:
+            changed = future.result()
         except Exception:
-            return None
-    return local_icon_path
+            continue
+        if changed:
+            for key in [k for k in icon_cache_images if k.startswith(app_id + "_")]:
+                del icon_cache_images[key]
+        for canvas, app, icon_size in icon_widgets.pop(app_id, []):
+            # Recycled cards may show a different app by now
+            if canvas.winfo_exists() and getattr(canvas, "app_id", None) == app_id:
+                draw_icon(canvas, app, icon_size)
+    if any(not f.done() for f in icon_fetches.values()) or not icon_ready.empty():
+        root.after(100, drain_icon_queue)
 
 def load_icon_image(app, max_size=56):
     """
-    Load and downscale icon to fit inside max_size x max_size,
-    preserving aspect ratio, using PhotoImage.subsample.
+    Load the icon's pre-scaled variant for max_size. Icons without one
+    (other sizes, sources PhotoImage couldn't scale) are decoded here and
+    shrunk to fit with PhotoImage.subsample.
     """
     app_id = app.get("id", "unknown")
     cache_key = f"{app_id}_{max_size}"
     if cache_key in icon_cache_images:
         return icon_cache_images[cache_key]
 
-    local_icon_path = download_icon_if_needed(app)
-    if not local_icon_path or not os.path.exists(local_icon_path):
+    with icon_meta_lock:
+        variant = icon_variants.get(app_id, {}).get(max_size)
+    if variant and os.path.exists(variant):
+        try:
+            img = tk.PhotoImage(file=variant)
+            icon_cache_images[cache_key] = img
+            return img
+        except Exception:
+            pass
+    future = icon_fetches.get(app_id)
+    if future is not None and not future.done() and max_size in ICON_VARIANT_SIZES:
+        # Variant is being made; the placeholder is swapped out when it's ready
+        return None
+
+    result = get_icon_path_for_app(app)
+    if not result or not os.path.exists(result[1]):
         return None
+    local_icon_path = result[1]
     try:
         img = tk.PhotoImage(file=local_icon_path)
     except Exception:
@@ -158,16 +732,37 @@ def load_icon_image(app, max_size=56):
     icon_cache_images[cache_key] = img
     return img
 
-def clear_icon_cache_for_app(app_id):
+def clear_icon_cache_for_app(app):
+    """
+    Drop an app's cached icon (on uninstall) and queue a fresh download,
+    so cards showing it get the icon back. Variants are keyed by content
+    hash, so one is only deleted when no other app's icon still uses it.
+    """
+    app_id = app.get("id", "unknown")
     keys_to_delete = [k for k in icon_cache_images.keys() if k.startswith(app_id + "_")]
     for k in keys_to_delete:
         del icon_cache_images[k]
+    icon_fetches.pop(app_id, None)
+    with icon_meta_lock:
+        if icon_meta.pop(app_id, None) is not None:
+            write_file_atomic(ICON_META_FILE, json.dumps(icon_meta))
+        variants = icon_variants.pop(app_id, {})
+        in_use = {path for other in icon_variants.values() for path in other.values()}
+    for path in variants.values():
+        if path in in_use:
+            continue
+        try:
+            os.remove(path)
+        except Exception:
+            pass
     for fname in os.listdir(ICON_CACHE_DIR):
-        if fname.startswith(app_id):
+        # Exact id match, so "foo" doesn't take "foobar"'s icon with it
+        if os.path.splitext(fname)[0] == app_id:
             try:
                 os.remove(os.path.join(ICON_CACHE_DIR, fname))
             except Exception:
                 pass
+    prefetch_icons([app])
 
 def create_rounded_icon_widget(parent, app, tile_bg, size=64, icon_size=56):
     """
@@ -182,16 +777,31 @@ def create_rounded_icon_widget(parent, app, tile_bg, size=64, icon_size=56):
     canvas.create_oval(margin, margin, size - margin, size - margin,
                        fill="#0f172a", outline="")
 
+    set_icon(canvas, app, icon_size)
+    return canvas
+
+def set_icon(canvas, app, icon_size):
+    """Draw app's icon on canvas (which may be reused for another app later)."""
+    app_id = app.get("id", "unknown")
+    canvas.app_id = app_id
+    draw_icon(canvas, app, icon_size)
+
+    # Redraw once the background download for this icon finishes
+    future = icon_fetches.get(app_id)
+    if future is not None and not future.done():
+        icon_widgets.setdefault(app_id, []).append((canvas, app, icon_size))
+
+def draw_icon(canvas, app, icon_size):
+    size = int(canvas.cget("width"))
+    canvas.delete("icon")
     icon_img = load_icon_image(app, max_size=icon_size)
     if icon_img is not None:
-        canvas.create_image(size // 2, size // 2, image=icon_img)
+        canvas.create_image(size // 2, size // 2, image=icon_img, tags="icon")
         # Keep a reference so it's not garbage collected
         canvas.image = icon_img
     else:
         # Fallback emoji placeholder
-        canvas.create_text(size // 2, size // 2, text="🟦", font=("Arial", 18))
-
-    return canvas
+        canvas.create_text(size // 2, size // 2, text="🟦", font=("Arial", 18), tags="icon")
 
 # =========================
 # Files from JSON
@@ -220,17 +830,11 @@ def run_commands(cmd_list, title):
         subprocess.run(cmd, shell=True, check=True)
 
 def install_app(app):
+    if job_for_app(app["id"]):
+        messagebox.showinfo("Busy", f"{app['name']} already has a job queued.")
+        return
     create_files(app)
-    try:
-        run_commands(app.get("install", []), "Install")
-        local_versions[app["id"]] = app["version"]
-        save_local_versions(local_versions)
-        messagebox.showinfo(
-            "Installed",
-            f"{app['name']} v{app['version']} installed successfully."
-        )
-    except Exception as e:
-        messagebox.showerror("Error", f"Install failed:\n{e}")
+    submit_job(InstallJob(app, "Install", app.get("install", [])))
 
 def uninstall_app(app):
     app_id = app["id"]
@@ -246,18 +850,403 @@ def uninstall_app(app):
     if not confirm:
         return
 
-    try:
-        uninstall_cmds = app.get("uninstall", [])
-        if uninstall_cmds:
-            run_commands(uninstall_cmds, "Uninstall")
+    if job_for_app(app_id):
+        messagebox.showinfo("Busy", f"{app['name']} already has a job queued.")
+        return
+    submit_job(InstallJob(app, "Uninstall", app.get("uninstall", [])))
+
+def on_job_finished(job):
+    """Runs on the Tk thread once a job leaves the queue."""
+    app = job.app
+    app_id = app["id"]
+    if job.state == "cancelled":
+        return
+    if job.state == "failed":
+        messagebox.showerror("Error", f"{job.action} failed:\n{job.error}")
+        return
+
+    if job.action == "Install":
+        local_versions[app_id] = app["version"]
+        save_local_versions(local_versions)
+        messagebox.showinfo(
+            "Installed",
+            f"{app['name']} v{app['version']} installed successfully."
+        )
+    else:
         if app_id in local_versions:
             del local_versions[app_id]
             save_local_versions(local_versions)
-        clear_icon_cache_for_app(app_id)
+        clear_icon_cache_for_app(app)
         messagebox.showinfo("Uninstalled", f"{app['name']} was uninstalled.")
-        refresh_all_views()
-    except Exception as e:
-        messagebox.showerror("Error", f"Uninstall failed:\n{e}")
+    update_app_views(app)
+
+# =========================
+# Install job queue
+# =========================
+
+APT_STEP_REGEX = re.compile(r"\b(apt|apt-get|dpkg)\b")
+APT_UPDATE_REGEX = re.compile(r"^\s*(sudo\s+)?apt(-get)?\s+update\s*$")
+APT_INSTALL_REGEX = re.compile(
+    r"^\s*(sudo\s+)?apt(-get)?\s+install\s+-y\s+(?P<packages>[A-Za-z0-9.+:=_\-\s]+)$"
+)
+ACTIVE_JOB_STATES = ("queued", "running")
+
+# apt and dpkg hold a system-wide lock, so only one such step runs at a time
+apt_lock = threading.Lock()
+job_pool = ThreadPoolExecutor(max_workers=JOB_WORKERS)
+job_events = queue.Queue()
+jobs = []
+jobs_lock = threading.Lock()
+# Install jobs whose leading apt lines haven't run yet (guarded by jobs_lock)
+apt_waiting = []
+# True while a drain_job_events() call is pending on the Tk loop
+job_drain_scheduled = False
+
+def split_apt_prefix(commands):
+    """Split off the plain apt update/install lines a command list starts with."""
+    for i, cmd in enumerate(commands):
+        if not (APT_UPDATE_REGEX.match(cmd) or APT_INSTALL_REGEX.match(cmd)):
+            return list(commands[:i]), list(commands[i:])
+    return list(commands), []
+
+def build_install_plan(command_lists):
+    """
+    Merge several apps' install commands into one command list: a single
+    "apt update", a single "apt install -y" with every package, then each
+    app's remaining steps in order.
+
+    Only the plain apt update/install lines an app starts with are merged;
+    once an app runs anything else, its later apt lines stay where they
+    are, since they may depend on that step (e.g. adding a repository).
+    """
+    update = False
+    packages = []
+    rest = []
+    for commands in command_lists:
+        leading, remaining = split_apt_prefix(commands)
+        for cmd in leading:
+            match = APT_INSTALL_REGEX.match(cmd)
+            if not match:
+                update = True
+                continue
+            for package in match.group("packages").split():
+                if package not in packages:
+                    packages.append(package)
+        rest.extend(remaining)
+
+    plan = []
+    if update:
+        plan.append("sudo apt update")
+    if packages:
+        plan.append("sudo apt install -y " + " ".join(packages))
+    return plan + rest
+
+def benchmark_install_plan():
+    """Show how many apt runs installing every catalog app takes, one by one vs. merged."""
+    apps = load_catalog_snapshot() or load_catalog() or []
+    command_lists = [expand_list(app.get("install", [])) for app in apps]
+    separate = [cmd for commands in command_lists for cmd in commands]
+    merged = build_install_plan(command_lists)
+    count_apt = lambda commands: sum(1 for cmd in commands if APT_STEP_REGEX.search(cmd))
+    print(f"{len(apps)} apps")
+    print(f"one by one: {len(separate)} steps, {count_apt(separate)} apt runs")
+    print(f"merged:     {len(merged)} steps, {count_apt(merged)} apt runs")
+    for cmd in merged:
+        print("  $ " + cmd)
+    benchmark_merged_jobs()
+
+# Stand-in step costs (seconds) for the stubbed install run
+STUB_APT_UPDATE_SECONDS = 0.3
+STUB_APT_INSTALL_SECONDS = 0.2
+STUB_STEP_SECONDS = 0.02
+
+def benchmark_merged_jobs():
+    """
+    Run three stubbed installs one by one, then queued together behind a
+    busy apt step; check that their apt lines merged and the time saved.
+    """
+    class StubJob(InstallJob):
+        def _run_step(self, cmd, check_cancel=True):
+            ran.append(cmd)
+            if APT_UPDATE_REGEX.match(cmd):
+                time.sleep(STUB_APT_UPDATE_SECONDS)
+            elif APT_INSTALL_REGEX.match(cmd):
+                time.sleep(STUB_APT_INSTALL_SECONDS)
+            else:
+                time.sleep(STUB_STEP_SECONDS)
+
+    apps = [
+        {"id": name, "name": name,
+         "install": ["sudo apt update", f"sudo apt install -y {name}-pkg shared-pkg",
+                     f"wget -O /tmp/{name} http://example.invalid/{name}"]}
+        for name in ("alpha", "beta", "gamma")
+    ]
+
+    timings = {}
+    with jobs_lock:
+        saved_jobs = jobs[:]
+    pool = ThreadPoolExecutor(max_workers=JOB_WORKERS)
+    try:
+        for label in ("one by one", "queued"):
+            ran = []
+            group = [StubJob(app, "Install", app["install"]) for app in apps]
+            t0 = time.perf_counter()
+            if label == "one by one":
+                for job in group:
+                    enqueue_job(job, pool).result()
+            else:
+                # Queued while another apt step holds the lock
+                with apt_lock:
+                    futures = [enqueue_job(job, pool) for job in group]
+                for future in futures:
+                    future.result()
+            timings[label] = time.perf_counter() - t0
+            assert all(job.state == "done" for job in group), [job.state for job in group]
+            print(f"{label:<11} {len(ran)} steps  {timings[label]:.2f} s")
+            for cmd in ran:
+                print("  $ " + cmd)
+    finally:
+        pool.shutdown()
+        with jobs_lock:
+            jobs[:] = saved_jobs
+
+    assert not apt_waiting
+    assert sorted(ran) == sorted(build_install_plan([app["install"] for app in apps])), ran
+    assert ran[:2] == ["sudo apt update", "sudo apt install -y alpha-pkg shared-pkg beta-pkg gamma-pkg"], ran
+    saved = timings["one by one"] - timings["queued"]
+    expected = 2 * (STUB_APT_UPDATE_SECONDS + STUB_APT_INSTALL_SECONDS)
+    assert saved > expected * 0.8, saved
+    print(f"saved {saved:.2f} s (expected at least {expected:.2f} s)")
+
+class InstallJob:
+    """One install/uninstall run: its commands, state and captured output."""
+
+    def __init__(self, app, action, commands):
+        self.app = app
+        self.action = action
+        self.commands = expand_list(commands)
+        self.state = "queued"        # queued, running, done, failed, cancelled
+        self.output = []
+        self.error = None
+        self.process = None
+        # Set while an apt/dpkg step runs; those are never killed midway
+        self.in_apt_step = False
+        self.cancel_requested = False
+        # An install's leading apt lines; whichever waiting install gets the
+        # apt lock first runs them for every install waiting with it
+        if action == "Install":
+            self.apt_steps, self.steps = split_apt_prefix(self.commands)
+        else:
+            self.apt_steps, self.steps = [], self.commands
+        self.apt_done = threading.Event()
+        self.apt_error = None
+        self.hashes = dict(app.get("hashes", {}))
+
+    def label(self):
+        return f"{self.action} {self.app.get('name', self.app['id'])} - {self.state}"
+
+    def log(self, line):
+        self.output.append(line)
+        job_events.put(self)
+
+    def cancel(self):
+        self.cancel_requested = True
+        process = self.process
+        if process is None or process.poll() is not None:
+            return
+        if self.in_apt_step:
+            # Killing apt/dpkg can leave packages half-configured; the job
+            # stops before its next step instead
+            self.log("Cancel requested; stopping once this apt step finishes")
+            return
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+        except Exception:
+            pass
+
+    def run(self):
+        with jobs_lock:
+            if self.cancel_requested:
+                self.state = "cancelled"
+                if self in apt_waiting:
+                    apt_waiting.remove(self)
+                job_events.put(self)
+                return
+            self.state = "running"
+        job_events.put(self)
+
+        try:
+            if self.apt_steps:
+                self._run_apt_phase()
+            for cmd in self.steps:
+                if APT_STEP_REGEX.search(cmd):
+                    with apt_lock:
+                        self._run_step(cmd)
+                else:
+                    self._run_step(cmd)
+            self.state = "done"
+        except Exception as e:
+            self.state = "cancelled" if self.cancel_requested else "failed"
+            self.error = e
+        job_events.put(self)
+
+    def _run_apt_phase(self):
+        """
+        Run this install's leading apt lines, merged with those of every
+        install still waiting for theirs, unless another install already
+        ran them. The other jobs keep running their own steps in their lanes.
+        """
+        with apt_lock:
+            if not self.apt_done.is_set():
+                with jobs_lock:
+                    if self.cancel_requested:
+                        if self in apt_waiting:
+                            apt_waiting.remove(self)
+                        raise RuntimeError("Cancelled")
+                    group = [self] + [job for job in apt_waiting
+                                      if job is not self and not job.cancel_requested]
+                    apt_waiting[:] = [job for job in apt_waiting if job not in group]
+                others = group[1:]
+                if others:
+                    self.log("apt steps combined with: "
+                             + ", ".join(job.app.get("name", job.app["id"]) for job in others))
+                    for job in others:
+                        job.log(f"apt steps run with {self.app.get('name', self.app['id'])}'s install")
+                error = None
+                try:
+                    # Not cancellable midway: the transaction belongs to the group
+                    for cmd in build_install_plan([job.apt_steps for job in group]):
+                        self._run_step(cmd, check_cancel=False)
+                except Exception as e:
+                    error = e
+                for job in group:
+                    job.apt_error = error
+                    job.apt_done.set()
+        if self.apt_error is not None:
+            raise self.apt_error
+
+    def _run_step(self, cmd, check_cancel=True):
+        if check_cancel and self.cancel_requested:
+            raise RuntimeError("Cancelled")
+        self.log(f"$ {cmd}")
+        download = WGET_STEP_REGEX.match(cmd)
+        if download:
+            url = download.group("url") or download.group("url2")
+            path = download.group("path") or download.group("path2")
+            source = artifact_cache.fetch(url, path, self.hashes.get(url))
+            self.log(f"{source}: {url}")
+            return
+        self.in_apt_step = bool(APT_STEP_REGEX.search(cmd))
+        # Own process group so cancel() can stop the whole pipeline
+        self.process = subprocess.Popen(
+            cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, errors="replace", start_new_session=True
+        )
+        for line in self.process.stdout:
+            self.log(line.rstrip("\n"))
+        code = self.process.wait()
+        self.in_apt_step = False
+        if code != 0:
+            raise subprocess.CalledProcessError(code, cmd)
+
+def job_for_app(app_id):
+    for job in jobs:
+        if job.app["id"] == app_id and job.state in ACTIVE_JOB_STATES:
+            return job
+    return None
+
+def enqueue_job(job, pool=None):
+    """Register a job and start it on the pool (no Tk needed). Returns its future."""
+    with jobs_lock:
+        jobs.append(job)
+        if job.apt_steps:
+            apt_waiting.append(job)
+    return (pool or job_pool).submit(job.run)
+
+def submit_job(job):
+    enqueue_job(job)
+    jobs_list.selection_clear(0, "end")
+    show_jobs_panel()
+    refresh_jobs_panel()
+    schedule_job_drain()
+
+def schedule_job_drain():
+    """Start the job event poll unless it is already running; only one ever is."""
+    global job_drain_scheduled
+    if not job_drain_scheduled:
+        job_drain_scheduled = True
+        root.after(200, drain_job_events)
+
+def drain_job_events():
+    global job_drain_scheduled
+    job_drain_scheduled = False
+    finished = []
+    changed = False
+    while True:
+        try:
+            job = job_events.get_nowait()
+        except queue.Empty:
+            break
+        changed = True
+        if job.state in ("done", "failed", "cancelled") and job not in finished:
+            finished.append(job)
+    if changed:
+        refresh_jobs_panel()
+    for job in finished:
+        if not getattr(job, "reported", False):
+            job.reported = True
+            on_job_finished(job)
+    # Stops once the queue is idle; the next submit_job() starts it again
+    if any(job.state in ACTIVE_JOB_STATES for job in jobs) or not job_events.empty():
+        schedule_job_drain()
+
+def show_jobs_panel():
+    if not jobs_panel.winfo_ismapped():
+        jobs_panel.pack(side="bottom", fill="x", padx=16, pady=(0, 12), before=content)
+
+def refresh_jobs_panel():
+    selection = jobs_list.curselection()
+    selected = selection[0] if selection else len(jobs) - 1
+    jobs_list.delete(0, "end")
+    for job in jobs:
+        jobs_list.insert("end", job.label())
+    if jobs:
+        jobs_list.selection_set(selected)
+        jobs_list.see(selected)
+        show_job_output(jobs[selected])
+
+def show_job_output(job):
+    jobs_output.configure(state="normal")
+    jobs_output.delete("1.0", "end")
+    jobs_output.insert("1.0", "\n".join(job.output[-500:]))
+    jobs_output.see("end")
+    jobs_output.configure(state="disabled")
+
+def cancel_selected_job():
+    selection = jobs_list.curselection()
+    if selection:
+        jobs[selection[0]].cancel()
+
+def build_jobs_panel(parent, bg, fg):
+    global jobs_panel, jobs_list, jobs_output
+    jobs_panel = tk.Frame(parent, bg=bg)
+
+    header = tk.Frame(jobs_panel, bg=bg)
+    header.pack(fill="x")
+    tk.Label(header, text="Install queue", font=("Arial", 11, "bold"),
+             bg=bg, fg=fg).pack(side="left")
+    ttk.Button(header, text="Cancel selected", command=cancel_selected_job).pack(side="right")
+
+    body = tk.Frame(jobs_panel, bg=bg)
+    body.pack(fill="x", pady=(4, 0))
+    jobs_list = tk.Listbox(body, height=6, width=36, exportselection=False)
+    jobs_list.pack(side="left", fill="y")
+    jobs_list.bind("<<ListboxSelect>>", lambda e: [
+        show_job_output(jobs[i]) for i in jobs_list.curselection()
+    ])
+    jobs_output = tk.Text(body, height=6, wrap="none", bd=0,
+                          bg="#020617", fg="#e5e7eb", state="disabled")
+    jobs_output.pack(side="left", fill="both", expand=True, padx=(8, 0))
 
 def launch_app(app):
     app_id = app["id"]
@@ -284,7 +1273,6 @@ def handle_install_button(app):
 
     if local_version is None:
         install_app(app)
-        refresh_all_views()
         return
 
     if local_version == remote_version:
@@ -303,7 +1291,6 @@ def handle_install_button(app):
     )
     if choice:
         install_app(app)
-        refresh_all_views()
     else:
         messagebox.showinfo("Keeping Version", "Keeping installed version.")
 
@@ -355,6 +1342,16 @@ def make_linked_label(parent, text, fg="white", bg=None):
         bg=bg or parent.cget("bg"), fg=fg
     )
     text_widget.pack(fill="both", expand=True)
+    frame.text_widget = text_widget
+    set_linked_text(text_widget, text)
+    return frame
+
+def set_linked_text(text_widget, text):
+    text_widget.configure(state="normal")
+    text_widget.delete("1.0", "end")
+    for tag in text_widget.tag_names():
+        if tag != "sel":
+            text_widget.tag_delete(tag)
 
     text_widget.insert("1.0", text)
 
@@ -366,11 +1363,11 @@ def make_linked_label(parent, text, fg="white", bg=None):
         text_widget.tag_add(url, start_index, end_index)
         text_widget.tag_config(url, foreground="#61afef", underline=1)
         def callback(event, link=url):
+            import webbrowser
             webbrowser.open(link)
         text_widget.tag_bind(url, "<Button-1>", callback)
 
     text_widget.configure(state="disabled")
-    return frame
 
 # =========================
 # Theme (pure tk, no ttk bg hacks)
@@ -461,6 +1458,7 @@ def open_app_details(app):
     homepage = app.get("homepage")
     if homepage:
         def open_home():
+            import webbrowser
             webbrowser.open(homepage)
         ttk.Button(center, text="Open homepage", command=open_home).pack(anchor="w", pady=(4, 8))
 
@@ -485,95 +1483,242 @@ def open_app_details(app):
 # App card
 # =========================
 
-def build_app_card(parent, app, compact=False):
-    colors = get_theme_colors()
-    tile_bg = colors["tile"]
-    fg_main = "#ffffff"
-    fg_sub = "#d1d5db"
+class AppCard:
+    """
+    One app tile. The widgets are built once and show() can point them at
+    a different app, so lists can recycle cards instead of rebuilding.
+    """
 
-    app_id = app["id"]
-    name = app.get("name", app_id)
-    creator = app.get("creator", "Unknown creator")
-    description = app.get("description", "")
-    remote_version = app.get("version", "0.0")
-    local_version = local_versions.get(app_id)
+    def __init__(self, parent, compact=False):
+        self.app = None
+        self.compact = compact
 
-    card = tk.Frame(parent, bd=0, bg=parent.cget("bg"), highlightthickness=0)
-    card.pack(fill="x", pady=8, padx=10)
+        self.frame = tk.Frame(parent, bd=0, highlightthickness=0)
+        # Tiles have their own colours; AppCard.show() recolours them
+        self.frame.skip_recolor = True
 
-    inner = tk.Frame(card, bg=tile_bg)
-    inner.pack(fill="both", expand=True, padx=8, pady=8)
+        self.inner = tk.Frame(self.frame)
+        self.inner.pack(fill="both", expand=True, padx=8, pady=8)
 
-    top_frame = tk.Frame(inner, bg=tile_bg)
-    top_frame.pack(fill="x")
+        self.top_frame = tk.Frame(self.inner)
+        self.top_frame.pack(fill="x")
 
-    # Rounded icon container
-    icon_container = tk.Frame(top_frame, bg=tile_bg)
-    icon_container.pack(side="left", padx=(0, 10))
-    icon_canvas = create_rounded_icon_widget(icon_container, app, tile_bg=tile_bg, size=64, icon_size=56)
-    icon_canvas.pack()
+        # Rounded icon container
+        self.icon_container = tk.Frame(self.top_frame)
+        self.icon_container.pack(side="left", padx=(0, 10))
+        self.icon_canvas = tk.Canvas(self.icon_container, width=64, height=64,
+                                     highlightthickness=0, bd=0)
+        self.icon_canvas.create_oval(4, 4, 60, 60, fill="#0f172a", outline="")
+        self.icon_canvas.pack()
 
-    text_frame = tk.Frame(top_frame, bg=tile_bg)
-    text_frame.pack(side="left", fill="x", expand=True)
+        self.text_frame = tk.Frame(self.top_frame)
+        self.text_frame.pack(side="left", fill="x", expand=True)
 
-    name_label = tk.Label(text_frame, text=name,
-                          font=("Arial", 14, "bold"), bg=tile_bg, fg=fg_main)
-    name_label.pack(anchor="w")
+        self.name_label = tk.Label(self.text_frame, font=("Arial", 14, "bold"))
+        self.name_label.pack(anchor="w")
 
-    creator_label = tk.Label(text_frame, text=f"by {creator}",
-                             font=("Arial", 10, "italic"),
-                             bg=tile_bg, fg=fg_sub)
-    creator_label.pack(anchor="w")
+        self.creator_label = tk.Label(self.text_frame, font=("Arial", 10, "italic"))
+        self.creator_label.pack(anchor="w")
 
-    if not compact:
-        make_linked_label(inner, description, fg=fg_main, bg=tile_bg)
+        self.description = None
+        if not compact:
+            self.description = make_linked_label(self.inner, "")
 
-    version_text = ""
-    if local_version:
-        if local_version == remote_version:
-            version_text = f"Installed: {local_version} (up to date)"
+        self.version_label = tk.Label(self.inner, font=("Arial", 9))
+        self.version_label.pack(anchor="w")
+
+        self.btn_frame = tk.Frame(self.inner)
+        self.btn_frame.pack(anchor="e", pady=(6, 0))
+
+        ttk.Button(
+            self.btn_frame,
+            text="More info",
+            command=lambda: open_app_details(self.app)
+        ).pack(side="left", padx=4)
+
+        self.primary_btn = ttk.Button(
+            self.btn_frame,
+            command=lambda: handle_install_button(self.app)
+        )
+        self.primary_btn.pack(side="left", padx=4)
+
+        ttk.Button(
+            self.btn_frame,
+            text="Open",
+            command=lambda: launch_app(self.app)
+        ).pack(side="left", padx=4)
+
+        ttk.Button(
+            self.btn_frame,
+            text="Uninstall",
+            command=lambda: uninstall_app(self.app)
+        ).pack(side="left", padx=4)
+
+    def show(self, app):
+        colors = get_theme_colors()
+        tile_bg = colors["tile"]
+        fg_main = "#ffffff"
+        fg_sub = "#d1d5db"
+
+        app_id = app["id"]
+        remote_version = app.get("version", "0.0")
+        local_version = local_versions.get(app_id)
+
+        self.frame.configure(bg=self.frame.master.cget("bg"))
+        for w in (self.inner, self.top_frame, self.icon_container,
+                  self.text_frame, self.btn_frame, self.icon_canvas):
+            w.configure(bg=tile_bg)
+
+        # Icon and description are the slow parts; only redo them for a new app
+        if self.app is not app:
+            set_icon(self.icon_canvas, app, 56)
+            if self.description is not None:
+                set_linked_text(self.description.text_widget, app.get("description", ""))
+        self.app = app
+
+        if self.description is not None:
+            self.description.configure(bg=tile_bg)
+            self.description.text_widget.configure(bg=tile_bg, fg=fg_main)
+
+        self.name_label.configure(text=app.get("name", app_id), bg=tile_bg, fg=fg_main)
+        self.creator_label.configure(text=f"by {app.get('creator', 'Unknown creator')}",
+                                     bg=tile_bg, fg=fg_sub)
+
+        if local_version:
+            if local_version == remote_version:
+                version_text = f"Installed: {local_version} (up to date)"
+            else:
+                version_text = f"Installed: {local_version} | Available: {remote_version}"
         else:
-            version_text = f"Installed: {local_version} | Available: {remote_version}"
-    else:
-        version_text = f"Available: {remote_version}"
+            version_text = f"Available: {remote_version}"
+        self.version_label.configure(text=version_text, bg=tile_bg, fg=fg_sub)
+
+        if local_version is None:
+            primary_text = "Install"
+        elif local_version != remote_version:
+            primary_text = "Update"
+        else:
+            primary_text = "Reinstall"
+        self.primary_btn.configure(text=primary_text)
+
+def build_app_card(parent, app, compact=False):
+    card = AppCard(parent, compact=compact)
+    card.show(app)
+    card.frame.pack(fill="x", pady=8, padx=10)
+    return card
 
-    version_label = tk.Label(inner, text=version_text,
-                             font=("Arial", 9), bg=tile_bg, fg=fg_sub)
-    version_label.pack(anchor="w")
+# =========================
+# Virtualized app lists
+# =========================
 
-    btn_frame = tk.Frame(inner, bg=tile_bg)
-    btn_frame.pack(anchor="e", pady=(6, 0))
+class VirtualAppList:
+    """
+    Scrollable list of app cards drawn straight onto a canvas. Only the
+    rows inside the viewport get a card; cards are reused as the list
+    scrolls, so cost depends on the window height, not on the app count.
+    All rows share the height of the first card measured.
+    """
 
-    ttk.Button(
-        btn_frame,
-        text="More info",
-        command=lambda a=app: open_app_details(a)
-    ).pack(side="left", padx=4)
+    ROW_GAP = 16
+    SIDE_PAD = 10
+
+    def __init__(self, canvas, scrollbar):
+        self.canvas = canvas
+        self.apps = []
+        self.cards = []
+        self.windows = []
+        self.row_height = None
+        self.empty_text = ""
+        self.empty_item = canvas.create_text(20, 20, anchor="nw", font=("Arial", 11))
+
+        scrollbar.configure(command=self.yview)
+        canvas.configure(yscrollcommand=scrollbar.set, yscrollincrement=1)
+        canvas.bind("<Configure>", lambda e: self.render())
+        for sequence in ("<Button-4>", "<Button-5>", "<MouseWheel>"):
+            canvas.bind_all(sequence, self._on_wheel, add="+")
+
+    def yview(self, *args):
+        self.canvas.yview(*args)
+        self.render()
+
+    def _on_wheel(self, event):
+        if not self.canvas.winfo_ismapped():
+            return
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            step = -1
+        else:
+            step = 1
+        self.canvas.yview_scroll(step * 60, "units")
+        self.render()
 
-    if local_version is None:
-        primary_text = "Install"
-    elif local_version != remote_version:
-        primary_text = "Update"
-    else:
-        primary_text = "Reinstall"
-
-    ttk.Button(
-        btn_frame,
-        text=primary_text,
-        command=lambda a=app: handle_install_button(a)
-    ).pack(side="left", padx=4)
-
-    ttk.Button(
-        btn_frame,
-        text="Open",
-        command=lambda a=app: launch_app(a)
-    ).pack(side="left", padx=4)
-
-    ttk.Button(
-        btn_frame,
-        text="Uninstall",
-        command=lambda a=app: uninstall_app(a)
-    ).pack(side="left", padx=4)
+    def set_apps(self, apps, empty_text=""):
+        self.apps = list(apps)
+        self.empty_text = empty_text
+        self.render()
+
+    def set_member(self, app, member):
+        """Add or remove one app, keeping catalog order."""
+        app_id = app["id"]
+        present = [i for i, a in enumerate(self.apps) if a["id"] == app_id]
+        if member and not present:
+            # Parallel key list: bisect's key= needs Python 3.10 (Bullseye has 3.9)
+            last = len(catalog_index)
+            keys = [catalog_index.get(a["id"], last) for a in self.apps]
+            position = bisect.bisect_left(keys, catalog_index.get(app_id, last))
+            self.apps.insert(position, app)
+        elif not member and present:
+            del self.apps[present[0]]
+        else:
+            return
+        self.render()
+
+    def refresh_app(self, app_id):
+        for card, window in zip(self.cards, self.windows):
+            if card.app is not None and card.app["id"] == app_id \
+                    and self.canvas.itemcget(window, "state") == "normal":
+                card.show(card.app)
+
+    def _ensure_cards(self, count):
+        while len(self.cards) < count:
+            card = AppCard(self.canvas)
+            window = self.canvas.create_window(self.SIDE_PAD, 0, window=card.frame,
+                                               anchor="nw", state="hidden")
+            self.cards.append(card)
+            self.windows.append(window)
+
+    def render(self):
+        canvas = self.canvas
+        colors = get_theme_colors()
+        canvas.configure(bg=colors["bg"])
+        canvas.itemconfigure(self.empty_item, fill=colors["fg_sub"],
+                             text="" if self.apps else self.empty_text)
+
+        width = max(canvas.winfo_width() - 2 * self.SIDE_PAD, 1)
+        height = max(canvas.winfo_height(), 1)
+
+        if self.apps and self.row_height is None:
+            self._ensure_cards(1)
+            self.cards[0].show(self.apps[0])
+            canvas.update_idletasks()
+            self.row_height = self.cards[0].frame.winfo_reqheight() + self.ROW_GAP
+
+        row_height = self.row_height or 1
+        total = len(self.apps) * row_height
+        canvas.configure(scrollregion=(0, 0, width, max(total, height)))
+
+        top = max(canvas.canvasy(0), 0)
+        first = int(top // row_height)
+        visible = int(height // row_height) + 2
+        self._ensure_cards(min(visible, len(self.apps)))
+
+        for slot, (card, window) in enumerate(zip(self.cards, self.windows)):
+            index = first + slot
+            if slot >= visible or index >= len(self.apps):
+                canvas.itemconfigure(window, state="hidden")
+                continue
+            card.show(self.apps[index])
+            canvas.coords(window, self.SIDE_PAD, index * row_height + self.ROW_GAP // 2)
+            canvas.itemconfigure(window, state="normal", width=width)
 
 # =========================
 # Views
@@ -581,6 +1726,7 @@ def build_app_card(parent, app, compact=False):
 
 def populate_home():
     clear_frame(home_frame)
+    home_cards.clear()
     colors = get_theme_colors()
     bg = colors["bg"]
     fg_main = colors["fg_main"]
@@ -602,6 +1748,7 @@ def populate_home():
         bg=bg,
         fg=fg_sub
     )
+    subtitle.role = "sub"
     subtitle.pack(anchor="w", padx=20, pady=(0, 15))
 
     if all_apps:
@@ -615,86 +1762,100 @@ def populate_home():
         featured_frame.pack(fill="x", padx=10)
         count = 0
         for app in all_apps:
-            build_app_card(featured_frame, app, compact=True)
+            home_cards.append(build_app_card(featured_frame, app, compact=True))
             count += 1
             if count >= 3:
                 break
 
 def populate_all_apps():
-    clear_frame(all_apps_inner)
-    colors = get_theme_colors()
-    bg = colors["bg"]
-    all_apps_inner.configure(bg=bg)
-    all_canvas.configure(bg=bg)
-
-    search_term = all_search_var.get().strip().lower()
-    for app in all_apps:
-        if search_term:
-            text_blob = " ".join([
-                str(app.get("name", "")),
-                str(app.get("creator", "")),
-                str(app.get("description", "")),
-                str(app.get("id", "")),
-                " ".join(app.get("tags", []))
-            ]).lower()
-            if search_term not in text_blob:
-                continue
-        build_app_card(all_apps_inner, app)
+    all_list.set_apps(search_index.search(all_search_var.get()))
+
+def schedule_search(*args):
+    # Wait until typing pauses before searching
+    global search_after_id
+    if search_after_id is not None:
+        root.after_cancel(search_after_id)
+    search_after_id = root.after(SEARCH_DEBOUNCE_MS, run_scheduled_search)
+
+def run_scheduled_search():
+    global search_after_id
+    search_after_id = None
+    populate_all_apps()
 
 def populate_installed():
-    clear_frame(installed_inner)
-    colors = get_theme_colors()
-    bg = colors["bg"]
-    fg_sub = colors["fg_sub"]
-    installed_inner.configure(bg=bg)
-    inst_canvas.configure(bg=bg)
-
-    any_installed = False
-    for app in all_apps:
-        app_id = app["id"]
-        if app_id in local_versions:
-            build_app_card(installed_inner, app)
-            any_installed = True
-    if not any_installed:
-        tk.Label(
-            installed_inner,
-            text="No apps installed yet. Go to All Apps to install something!",
-            font=("Arial", 11),
-            bg=bg,
-            fg=fg_sub
-        ).pack(pady=20)
+    installed = [app for app in all_apps if app["id"] in local_versions]
+    inst_list.set_apps(
+        installed,
+        empty_text="No apps installed yet. Go to All Apps to install something!"
+    )
 
 def populate_updates():
-    clear_frame(updates_inner)
-    colors = get_theme_colors()
-    bg = colors["bg"]
-    fg_sub = colors["fg_sub"]
-    updates_inner.configure(bg=bg)
-    upd_canvas.configure(bg=bg)
-
-    any_updates = False
+    updates = []
     for app in all_apps:
         app_id = app["id"]
         remote_version = app.get("version")
         local_version = local_versions.get(app_id)
         if local_version and remote_version and local_version != remote_version:
-            build_app_card(updates_inner, app)
-            any_updates = True
-    if not any_updates:
-        tk.Label(
-            updates_inner,
-            text="All apps are up to date.",
-            font=("Arial", 11),
-            bg=bg,
-            fg=fg_sub
-        ).pack(pady=20)
+            updates.append(app)
+    upd_list.set_apps(updates, empty_text="All apps are up to date.")
 
 def refresh_all_views(*args):
-    populate_home()
-    populate_all_apps()
-    populate_installed()
-    populate_updates()
-    build_settings_page()
+    """
+    Rebuild every tab built so far; only needed when the catalog itself
+    changes. Tabs not opened yet are filled in when they are built.
+    """
+    global search_index
+    catalog_index.clear()
+    catalog_index.update({app["id"]: i for i, app in enumerate(all_apps)})
+    search_index = SearchIndex(all_apps)
+    for tab_name in tab_frames:
+        TAB_POPULATE[tab_name]()
+    apply_colors_to_shell()
+
+def app_lists():
+    """The virtual app lists of the tabs built so far."""
+    return [view for view in (all_list, inst_list, upd_list) if view is not None]
+
+def update_app_views(app):
+    """After installing/uninstalling app, update just the cards it affects."""
+    app_id = app["id"]
+    remote_version = app.get("version")
+    local_version = local_versions.get(app_id)
+
+    if inst_list is not None:
+        inst_list.set_member(app, local_version is not None)
+    if upd_list is not None:
+        upd_list.set_member(
+            app, bool(local_version and remote_version and local_version != remote_version)
+        )
+    for view in app_lists():
+        view.refresh_app(app_id)
+    for card in home_cards:
+        if card.app["id"] == app_id:
+            card.show(card.app)
+
+def recolor_tree(widget, colors):
+    """Recolour plain tk frames and labels under widget in place."""
+    for child in widget.winfo_children():
+        if getattr(child, "skip_recolor", False) or isinstance(child, tk.Canvas):
+            continue
+        if isinstance(child, tk.Label):
+            fg = colors["fg_sub"] if getattr(child, "role", None) == "sub" else colors["fg_main"]
+            child.configure(bg=colors["bg"], fg=fg)
+        elif isinstance(child, tk.Frame):
+            child.configure(bg=colors["bg"])
+        recolor_tree(child, colors)
+
+def apply_theme():
+    """Recolour every view after a theme or colour change, without rebuilding."""
+    colors = get_theme_colors()
+    for frame in tab_frames.values():
+        frame.configure(bg=colors["bg"])
+        recolor_tree(frame, colors)
+    for card in home_cards:
+        card.show(card.app)
+    for view in app_lists():
+        view.render()
     apply_colors_to_shell()
 
 # =========================
@@ -704,24 +1865,26 @@ def refresh_all_views(*args):
 def on_theme_change(new_theme):
     settings["theme"] = new_theme
     save_settings(settings)
-    refresh_all_views()
+    apply_theme()
     update_nav_style()
 
 def choose_tile_color():
     initial = get_safe_color(settings.get("tile_bg_color"), "#1f3b5b")
+    from tkinter import colorchooser
     color = colorchooser.askcolor(initialcolor=initial)[1]
     if color:
         settings["tile_bg_color"] = color
         save_settings(settings)
-        refresh_all_views()
+        apply_theme()
 
 def choose_bg_color():
     initial = get_safe_color(settings.get("background_color"), "#0b1220")
+    from tkinter import colorchooser
     color = colorchooser.askcolor(initialcolor=initial)[1]
     if color:
         settings["background_color"] = color
         save_settings(settings)
-        refresh_all_views()
+        apply_theme()
 
 def reset_settings():
     confirm = messagebox.askyesno(
@@ -733,7 +1896,10 @@ def reset_settings():
     for k in list(settings.keys()):
         settings[k] = DEFAULT_SETTINGS.get(k, settings[k])
     save_settings(settings)
-    refresh_all_views()
+    # The settings widgets hold the old values, so that page is rebuilt
+    if "Settings" in tab_frames:
+        build_settings_page()
+    apply_theme()
     update_nav_style()
 
 def build_settings_page():
@@ -810,6 +1976,7 @@ def build_settings_page():
         bg=bg,
         fg=fg_sub
     )
+    info.role = "sub"
     info.pack(anchor="w", padx=20, pady=(10, 0))
 
 # =========================
@@ -819,26 +1986,97 @@ def build_settings_page():
 nav_buttons = {}
 current_tab = None
 
+# Compact cards on the Home tab, and each app's position in the catalog
+home_cards = []
+catalog_index = {}
+search_index = SearchIndex([])
+search_after_id = None
+
+# Tabs are built the first time they are shown, then kept
+TAB_NAMES = ["Home", "All Apps", "Installed", "Updates", "Settings"]
+tab_frames = {}
+all_list = inst_list = upd_list = None
+
+def build_home_tab(bg, fg_main):
+    global home_frame
+    home_frame = tk.Frame(content, bg=bg)
+    return home_frame
+
+def build_all_apps_tab(bg, fg_main):
+    global all_apps_frame, all_search_var, all_canvas, all_list
+    all_apps_frame = tk.Frame(content, bg=bg)
+    all_search_bar = tk.Frame(all_apps_frame, bg=bg)
+    all_search_bar.pack(fill="x", pady=(8, 4), padx=10)
+
+    tk.Label(all_search_bar, text="Search:", bg=bg, fg=fg_main).pack(side="left")
+    all_search_var = tk.StringVar()
+    all_search_entry = ttk.Entry(all_search_bar, textvariable=all_search_var, width=40)
+    all_search_entry.pack(side="left", padx=6, fill="x", expand=True)
+    all_search_var.trace_add("write", schedule_search)
+
+    all_canvas = tk.Canvas(all_apps_frame, highlightthickness=0, bd=0, bg=bg)
+    all_scrollbar = ttk.Scrollbar(all_apps_frame, orient="vertical")
+    all_list = VirtualAppList(all_canvas, all_scrollbar)
+
+    all_canvas.pack(side="left", fill="both", expand=True)
+    all_scrollbar.pack(side="right", fill="y")
+    return all_apps_frame
+
+def build_list_tab(bg):
+    frame = tk.Frame(content, bg=bg)
+    canvas = tk.Canvas(frame, highlightthickness=0, bd=0, bg=bg)
+    scrollbar = ttk.Scrollbar(frame, orient="vertical")
+    view = VirtualAppList(canvas, scrollbar)
+    canvas.pack(side="left", fill="both", expand=True)
+    scrollbar.pack(side="right", fill="y")
+    return frame, canvas, view
+
+def build_installed_tab(bg, fg_main):
+    global installed_frame, inst_canvas, inst_list
+    installed_frame, inst_canvas, inst_list = build_list_tab(bg)
+    return installed_frame
+
+def build_updates_tab(bg, fg_main):
+    global updates_frame, upd_canvas, upd_list
+    updates_frame, upd_canvas, upd_list = build_list_tab(bg)
+    return updates_frame
+
+def build_settings_tab(bg, fg_main):
+    global settings_frame
+    settings_frame = tk.Frame(content, bg=bg)
+    return settings_frame
+
+TAB_BUILDERS = {
+    "Home": build_home_tab,
+    "All Apps": build_all_apps_tab,
+    "Installed": build_installed_tab,
+    "Updates": build_updates_tab,
+    "Settings": build_settings_tab
+}
+
+TAB_POPULATE = {
+    "Home": populate_home,
+    "All Apps": populate_all_apps,
+    "Installed": populate_installed,
+    "Updates": populate_updates,
+    "Settings": build_settings_page
+}
+
+def ensure_tab(tab_name):
+    """Frame for tab_name, building and filling it on first use."""
+    if tab_name not in tab_frames:
+        colors = get_theme_colors()
+        tab_frames[tab_name] = TAB_BUILDERS[tab_name](colors["bg"], colors["fg_main"])
+        TAB_POPULATE[tab_name]()
+    return tab_frames[tab_name]
+
 def set_tab(tab_name):
     global current_tab
     current_tab = tab_name
 
-    home_frame.pack_forget()
-    all_apps_frame.pack_forget()
-    installed_frame.pack_forget()
-    updates_frame.pack_forget()
-    settings_frame.pack_forget()
-
-    if tab_name == "Home":
-        home_frame.pack(fill="both", expand=True)
-    elif tab_name == "All Apps":
-        all_apps_frame.pack(fill="both", expand=True)
-    elif tab_name == "Installed":
-        installed_frame.pack(fill="both", expand=True)
-    elif tab_name == "Updates":
-        updates_frame.pack(fill="both", expand=True)
-    elif tab_name == "Settings":
-        settings_frame.pack(fill="both", expand=True)
+    for frame in tab_frames.values():
+        frame.pack_forget()
+    ensure_tab(tab_name).pack(fill="both", expand=True)
 
     update_nav_style()
 
@@ -897,16 +2135,37 @@ def apply_colors_to_shell():
     title_label.configure(bg=bg, fg=fg_main)
     version_label.configure(bg=bg, fg=fg_sub)
     content.configure(bg=bg)
+    jobs_panel.configure(bg=bg)
+    recolor_tree(jobs_panel, colors)
+
+# =========================
+# Catalog refresh
+# =========================
+
+def on_catalog_refreshed(apps, error, self_update=True):
+    if error is not None:
+        if not all_apps:
+            messagebox.showerror("Error", f"Failed to load app catalog:\n{error}")
+        return
+    if apps is None:
+        # Snapshot is still current; still check it, so a store left behind
+        # by a failed or interrupted self-update tries again
+        if self_update:
+            check_self_update(all_apps)
+        return
+    all_apps[:] = apps
+    if self_update:
+        check_self_update(apps)
+    prefetch_icons(apps)
+    refresh_all_views()
 
 # =========================
 # Main
 # =========================
 
-def main():
-    global root, home_frame, all_apps_frame, installed_frame, updates_frame, settings_frame
+def main(probe=False):
+    global root
     global all_apps, local_versions
-    global all_apps_inner, installed_inner, updates_inner
-    global all_search_var, all_canvas, inst_canvas, upd_canvas
     global nav_bar, nav_buttons, title_bar, title_label, version_label, content
 
     if not os.path.exists(LOCAL_DB):
@@ -916,16 +2175,9 @@ def main():
     local_versions_dict = load_local_versions()
     globals()["local_versions"] = local_versions_dict
 
-    try:
-        apps = load_catalog()
-    except Exception as e:
-        tk.Tk().withdraw()
-        messagebox.showerror("Error", f"Failed to load app catalog:\n{e}")
-        return
-
-    globals()["all_apps"] = apps
-
-    check_self_update(apps)
+    # Start from the last good catalog; the network copy arrives later
+    snapshot = load_catalog_snapshot()
+    globals()["all_apps"] = snapshot or []
 
     root = tk.Tk()
     root.title("Camcookie Appstore V1.5")
@@ -969,91 +2221,131 @@ def main():
         btn.pack(side="left", padx=(0, 6))
         nav_buttons[name] = btn
 
-    for tab_name in ["Home", "All Apps", "Installed", "Updates", "Settings"]:
+    for tab_name in TAB_NAMES:
         make_nav_button(tab_name)
 
     content = tk.Frame(root, bg=bg)
     content.pack(fill="both", expand=True, padx=16, pady=(0, 12))
 
-    home_frame = tk.Frame(content, bg=bg)
+    # Shown below the tabs once the first install/uninstall is queued
+    build_jobs_panel(root, bg, fg_main)
 
-    all_apps_frame = tk.Frame(content, bg=bg)
-    all_search_bar = tk.Frame(all_apps_frame, bg=bg)
-    all_search_bar.pack(fill="x", pady=(8, 4), padx=10)
-
-    tk.Label(all_search_bar, text="Search:", bg=bg, fg=fg_main).pack(side="left")
-    all_search_var = tk.StringVar()
-    all_search_entry = ttk.Entry(all_search_bar, textvariable=all_search_var, width=40)
-    all_search_entry.pack(side="left", padx=6, fill="x", expand=True)
-    all_search_var.trace_add("write", lambda *args: populate_all_apps())
-
-    all_canvas = tk.Canvas(all_apps_frame, highlightthickness=0, bd=0, bg=bg)
-    all_scrollbar = ttk.Scrollbar(all_apps_frame, orient="vertical", command=all_canvas.yview)
-    all_apps_inner = tk.Frame(all_canvas, bg=bg)
-
-    all_apps_inner.bind(
-        "<Configure>",
-        lambda e: all_canvas.configure(scrollregion=all_canvas.bbox("all"))
-    )
-
-    all_canvas.create_window((0, 0), window=all_apps_inner, anchor="nw")
-    all_canvas.configure(yscrollcommand=all_scrollbar.set)
+    prefetch_icons(all_apps)
+    # No tabs exist yet, so this only builds the indexes; set_tab() then
+    # builds the startup tab and the rest wait for their first visit
+    refresh_all_views()
 
-    all_canvas.pack(side="left", fill="both", expand=True)
-    all_scrollbar.pack(side="right", fill="y")
+    start_tab = settings.get("startup_tab", "Home")
+    if start_tab not in TAB_NAMES:
+        start_tab = "Home"
+    set_tab(start_tab)
 
-    installed_frame = tk.Frame(content, bg=bg)
-    inst_canvas = tk.Canvas(installed_frame, highlightthickness=0, bd=0, bg=bg)
-    inst_scrollbar = ttk.Scrollbar(installed_frame, orient="vertical", command=inst_canvas.yview)
-    installed_inner = tk.Frame(inst_canvas, bg=bg)
+    if probe:
+        # --startup-probe: report the first paint, then quit once the
+        # catalog refresh has filled the caches
+        root.update()
+        print("first paint", flush=True)
 
-    installed_inner.bind(
-        "<Configure>",
-        lambda e: inst_canvas.configure(scrollregion=inst_canvas.bbox("all"))
-    )
+    def catalog_done(apps, error):
+        # A probe run must never update the store itself
+        on_catalog_refreshed(apps, error, self_update=not probe)
+        if probe:
+            print("catalog refreshed", flush=True)
+            root.destroy()
 
-    inst_canvas.create_window((0, 0), window=installed_inner, anchor="nw")
-    inst_canvas.configure(yscrollcommand=inst_scrollbar.set)
-    inst_canvas.pack(side="left", fill="both", expand=True)
-    inst_scrollbar.pack(side="right", fill="y")
+    start_catalog_refresh(catalog_done)
 
-    updates_frame = tk.Frame(content, bg=bg)
-    upd_canvas = tk.Canvas(updates_frame, highlightthickness=0, bd=0, bg=bg)
-    upd_scrollbar = ttk.Scrollbar(updates_frame, orient="vertical", command=upd_canvas.yview)
-    updates_inner = tk.Frame(upd_canvas, bg=bg)
+    root.mainloop()
 
-    updates_inner.bind(
-        "<Configure>",
-        lambda e: upd_canvas.configure(scrollregion=upd_canvas.bbox("all"))
+def run_startup_probe(env):
+    """Start the store with --startup-probe; returns ms to (first paint, catalog refreshed)."""
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "--startup-probe"],
+        env=env, stdout=subprocess.PIPE, text=True
     )
+    marks = {}
+    for line in proc.stdout:
+        marks.setdefault(line.strip(), (time.perf_counter() - t0) * 1000)
+    proc.wait()
+    return marks.get("first paint"), marks.get("catalog refreshed"), proc.returncode
 
-    upd_canvas.create_window((0, 0), window=updates_inner, anchor="nw")
-    upd_canvas.configure(yscrollcommand=upd_scrollbar.set)
-    upd_canvas.pack(side="left", fill="both", expand=True)
-    upd_scrollbar.pack(side="right", fill="y")
-
-    settings_frame = tk.Frame(content, bg=bg)
-
-    globals().update({
-        "home_frame": home_frame,
-        "all_apps_frame": all_apps_frame,
-        "installed_frame": installed_frame,
-        "updates_frame": updates_frame,
-        "settings_frame": settings_frame,
-        "content": content,
-        "all_canvas": all_canvas,
-        "inst_canvas": inst_canvas,
-        "upd_canvas": upd_canvas
-    })
-
-    refresh_all_views()
-
-    start_tab = settings.get("startup_tab", "Home")
-    if start_tab not in ["Home", "All Apps", "Installed", "Updates", "Settings"]:
-        start_tab = "Home"
-    set_tab(start_tab)
-
-    root.mainloop()
+def benchmark_startup(runs=3, latencies=(0.0, 1.0, 3.0)):
+    """
+    Time to first paint of the startup tab, cold (empty ~/.camcookie) and
+    warm. Then the same against a local HTTP stand-in for the catalog that
+    answers after each latency: first paint must not grow with it.
+    """
+    import tempfile
+    from functools import partial
+    from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+    def fresh_home(home):
+        os.makedirs(os.path.join(home, ".camcookie"))
+        if os.path.exists(SETTINGS_FILE):
+            shutil.copyfile(SETTINGS_FILE, os.path.join(home, ".camcookie", "appstore-settings.json"))
+        return dict(os.environ, HOME=home)
+
+    print(f"startup tab: {settings.get('startup_tab', 'Home')}")
+    with tempfile.TemporaryDirectory() as home:
+        env = fresh_home(home)
+        for label in ["cold"] + ["warm"] * runs:
+            painted, _, code = run_startup_probe(env)
+            if painted is None:
+                print(f"{label:<5} no first paint (exit code {code})")
+            else:
+                print(f"{label:<5} first paint {painted:7.1f} ms")
+
+    latency = {"seconds": 0.0}
+
+    class SlowHandler(SimpleHTTPRequestHandler):
+        def end_headers(self):
+            time.sleep(latency["seconds"])
+            super().end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    site = os.path.dirname(os.path.abspath(__file__))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(SlowHandler, directory=site))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}/"
+    print(f"local catalog stand-in at {base}")
+    painted_at = []
+    try:
+        for seconds in latencies:
+            latency["seconds"] = seconds
+            with tempfile.TemporaryDirectory() as home:
+                env = dict(fresh_home(home), CAMCOOKIE_CATALOG_BASE=base)
+                # Fill the snapshot, then time a warm start against the slow catalog
+                run_startup_probe(env)
+                painted, refreshed, code = run_startup_probe(env)
+            if painted is None or refreshed is None:
+                print(f"latency {seconds:.1f} s: probe failed (exit code {code})")
+                continue
+            painted_at.append(painted)
+            print(f"latency {seconds:.1f} s: first paint {painted:7.1f} ms, "
+                  f"catalog refreshed {refreshed:7.1f} ms")
+    finally:
+        server.shutdown()
+        server.server_close()
+    if len(painted_at) == len(latencies):
+        spread = max(painted_at) - min(painted_at)
+        assert spread < latencies[-1] * 1000 / 2, f"first paint tracks latency ({spread:.0f} ms)"
+        print(f"first paint spread across latencies: {spread:.1f} ms")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if "--benchmark-search" in sys.argv:
+        benchmark_search()
+    elif "--benchmark-install-plan" in sys.argv:
+        benchmark_install_plan()
+    elif "--benchmark-artifacts" in sys.argv:
+        benchmark_artifacts()
+    elif "--benchmark-startup" in sys.argv:
+        benchmark_startup()
+    elif "--benchmark-icons" in sys.argv:
+        benchmark_icons()
+    elif len(sys.argv) > 2 and sys.argv[1] == "--render-icon-variants":
+        icon_render_helper(sys.argv[2:])
+    else:
+        main(probe="--startup-probe" in sys.argv)
\ No newline at end of file